@@ -7,6 +7,7 @@ Core kernel components including:
 - Event Loop
 - Subsystem Registry
 - Configuration Loader
+- Reader-Writer Lock
 """
 
 from .bootloader import Bootloader, BootStage, BootResult, boot_system
@@ -20,6 +21,7 @@ from .registry import (
     get_registry
 )
 from .config_loader import ConfigLoader, Config, get_config
+from .rwlock import RWLock
 
 __all__ = [
     # Bootloader
@@ -49,4 +51,6 @@ __all__ = [
     'ConfigLoader',
     'Config',
     'get_config',
+    # Synchronization
+    'RWLock',
 ]
@@ -0,0 +1,99 @@
+"""
+PyOS Reader-Writer Lock
+
+A reader-writer lock for kernel data structures that are read far more
+often than they are modified:
+- Any number of concurrent readers
+- Exclusive writers
+- Writer preference, so a steady stream of readers cannot starve writers
+
+Author: YSNRFD
+Version: 1.0.0
+"""
+
+import threading
+
+
+class _ReadGuard:
+    """Context manager holding an RWLock in shared mode."""
+    
+    __slots__ = ('_lock',)
+    
+    def __init__(self, lock: 'RWLock'):
+        self._lock = lock
+    
+    def __enter__(self) -> None:
+        self._lock.acquire_read()
+    
+    def __exit__(self, *exc_info) -> None:
+        self._lock.release_read()
+
+
+class _WriteGuard:
+    """Context manager holding an RWLock in exclusive mode."""
+    
+    __slots__ = ('_lock',)
+    
+    def __init__(self, lock: 'RWLock'):
+        self._lock = lock
+    
+    def __enter__(self) -> None:
+        self._lock.acquire_write()
+    
+    def __exit__(self, *exc_info) -> None:
+        self._lock.release_write()
+
+
+class RWLock:
+    """
+    Reader-writer lock.
+    
+    The lock is not re-entrant: a thread holding it in either mode must
+    not acquire it again.
+    
+    Example:
+        >>> lock = RWLock()
+        >>> with lock.read:
+        ...     value = table.get(key)
+        >>> with lock.write:
+        ...     table[key] = value
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        
+        # Stateless guards, shared by every caller
+        self.read = _ReadGuard(self)
+        self.write = _WriteGuard(self)
+    
+    def acquire_read(self) -> None:
+        """Acquire the lock in shared mode."""
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+    
+    def release_read(self) -> None:
+        """Release a shared hold."""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+    
+    def acquire_write(self) -> None:
+        """Acquire the lock in exclusive mode."""
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+    
+    def release_write(self) -> None:
+        """Release an exclusive hold."""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
@@ -14,8 +14,10 @@ Version: 1.0.0
 """
 
 import logging
+import os
 import sys
 import threading
+import time
 from datetime import datetime
 from enum import IntEnum
 from pathlib import Path
@@ -24,6 +26,46 @@ from functools import wraps
 import traceback
 
 
+# Shared empty context used when a log call carries no context. Treated as
+# read-only by convention so records without context don't allocate a dict.
+_EMPTY: dict[str, Any] = {}
+
+# Host process ID, cached so records don't pay for os.getpid() each time.
+# Refreshed in forked children, the only point where it can change.
+_PID = os.getpid()
+
+
+def _refresh_pid() -> None:
+    """Re-read the host process ID after a fork."""
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+# Bound once, so stamping a record with its thread is a single global lookup
+_get_ident = threading.get_ident
+
+# Yield the CPU between spin attempts; sleep(0) where sched_yield is missing
+_sched_yield = getattr(os, 'sched_yield', None) or (lambda: time.sleep(0))
+
+
+def _noop(self, *args, **kwargs) -> None:
+    """Stand-in bound over log methods that are below the active level."""
+    return None
+
+
+def _no_caller(*args, **kwargs) -> tuple:
+    """
+    Replacement for ``logging.Logger.findCaller``.
+    
+    LogFormatter never prints the source location, so skip the frame walk
+    ``logging`` would otherwise do for every record.
+    """
+    return "(unknown file)", 0, "(unknown function)", None
+
+
 class LogLevel(IntEnum):
     """Log level enumeration with numeric values for comparison."""
     DEBUG = 10
@@ -35,6 +77,18 @@ class LogLevel(IntEnum):
     PANIC = 60
 
 
+# Level-specific log methods that can be swapped for ``_noop`` when disabled
+_LEVEL_METHODS = (
+    ('debug', LogLevel.DEBUG),
+    ('info', LogLevel.INFO),
+    ('notice', LogLevel.NOTICE),
+    ('warning', LogLevel.WARNING),
+    ('error', LogLevel.ERROR),
+    ('critical', LogLevel.CRITICAL),
+    ('panic', LogLevel.PANIC),
+)
+
+
 class LogFormatter(logging.Formatter):
     """
     Custom log formatter for PyOS.
@@ -104,7 +158,7 @@ class LogFormatter(logging.Formatter):
         components.append(str(record.getMessage()))
         
         # Add extra context if available
-        if hasattr(record, 'context') and record.context:
+        if getattr(record, 'context', None):
             context_str = " ".join(f"{k}={v}" for k, v in record.context.items())
             components.append(f"{{{context_str}}}")
         
@@ -133,20 +187,59 @@ class KernelLogHandler(logging.Handler):
     
     def emit(self, record: logging.LogRecord) -> None:
         """Store log record in buffer."""
-        log_entry = {
+        self._append({
             'timestamp': record.created,
             'level': record.levelname,
             'message': record.getMessage(),
             'subsystem': getattr(record, 'subsystem', None),
             'pid': getattr(record, 'pid', None),
-            'context': getattr(record, 'context', {}),
-        }
+            'os_pid': getattr(record, 'os_pid', None),
+            'thread_id': getattr(record, 'thread_id', None),
+            'context': getattr(record, 'context', _EMPTY),
+        })
+    
+    def fast_emit(
+        self,
+        level_name: str,
+        message: str,
+        subsystem: Optional[str],
+        pid: Optional[int],
+        context: dict[str, Any],
+        timestamp: float,
+        os_pid: Optional[int] = None,
+        thread_id: Optional[int] = None
+    ) -> None:
+        """
+        Store a log entry without building a ``LogRecord``.
         
-        with self._lock:
+        Used by ``Logger`` to feed the kernel buffer directly, skipping
+        record construction and handler dispatch in the ``logging`` module.
+        """
+        self._append({
+            'timestamp': timestamp,
+            'level': level_name,
+            'message': message,
+            'subsystem': subsystem,
+            'pid': pid,
+            'os_pid': os_pid,
+            'thread_id': thread_id,
+            'context': context,
+        })
+    
+    def _append(self, log_entry: dict[str, Any]) -> None:
+        """Append an entry to the buffer, trimming it to ``max_entries``."""
+        # The critical section is tiny, so spin with non-blocking attempts
+        # rather than parking on the lock; cold paths keep blocking acquire.
+        lock = self._lock
+        while not lock.acquire(blocking=False):
+            _sched_yield()
+        try:
             self._log_buffer.append(log_entry)
             # Trim buffer if needed
             if len(self._log_buffer) > self.max_entries:
                 self._log_buffer = self._log_buffer[-self.max_entries:]
+        finally:
+            lock.release()
     
     def get_logs(
         self,
@@ -204,6 +297,8 @@ class Logger:
                 instance = super().__new__(cls)
                 instance._subsystem = subsystem
                 instance._logger = logging.getLogger(f'pyos.{subsystem}')
+                instance._logger.findCaller = _no_caller
+                instance._specialize()
                 cls._instances[subsystem] = instance
             return cls._instances[subsystem]
     
@@ -252,8 +347,8 @@ class Logger:
             console_handler.setFormatter(LogFormatter(use_colors=use_colors))
             root_logger.addHandler(console_handler)
             
-            # Add kernel handler
-            root_logger.addHandler(cls._kernel_handler)
+            # The kernel handler is not attached to the root logger: Logger
+            # feeds it directly through fast_emit.
             
             # Add file handler if specified
             if log_file:
@@ -265,6 +360,46 @@ class Logger:
                 root_logger.addHandler(file_handler)
             
             cls._initialized = True
+            
+            for instance in cls._instances.values():
+                instance._specialize()
+    
+    @classmethod
+    def set_level(cls, level: int) -> None:
+        """
+        Change the global log level at runtime.
+        
+        Updates every handler and subsystem logger, and re-specializes
+        the level methods of existing loggers.
+        
+        Args:
+            level: New minimum log level to capture
+        """
+        with cls._lock:
+            cls._global_level = level
+            
+            root_logger = logging.getLogger('pyos')
+            root_logger.setLevel(level)
+            for handler in root_logger.handlers:
+                handler.setLevel(level)
+            
+            for instance in cls._instances.values():
+                instance._logger.setLevel(level)
+                instance._specialize()
+    
+    def _specialize(self) -> None:
+        """
+        Bind no-ops over log methods below the global level.
+        
+        Disabled calls then cost a single bound-method call instead of a
+        trip through ``_log`` and the ``logging`` machinery. Methods that
+        are enabled again fall back to the class implementation.
+        """
+        for name, level in _LEVEL_METHODS:
+            if level < self._global_level:
+                setattr(self, name, _noop.__get__(self))
+            else:
+                self.__dict__.pop(name, None)
     
     @classmethod
     def get_kernel_logs(
@@ -278,6 +413,15 @@ class Logger:
             return []
         return cls._kernel_handler.get_logs(level=level, subsystem=subsystem, limit=limit)
     
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message at ``level`` would be logged.
+        
+        Lets hot paths skip building messages and context dicts for
+        records that would be discarded.
+        """
+        return self._logger.isEnabledFor(level)
+    
     def _log(
         self,
         level: int,
@@ -286,12 +430,29 @@ class Logger:
         context: Optional[dict[str, Any]] = None
     ) -> None:
         """Internal logging method."""
+        logger = self._logger
+        if not logger.isEnabledFor(level):
+            return
+        
+        if context is None:
+            context = _EMPTY
+        thread_id = _get_ident()
+        
+        kernel_handler = self._kernel_handler
+        if kernel_handler is not None:
+            kernel_handler.fast_emit(
+                logging.getLevelName(level), message, self._subsystem,
+                pid, context, time.time(), _PID, thread_id
+            )
+        
         extra = {
             'subsystem': self._subsystem,
             'pid': pid,
-            'context': context or {},
+            'os_pid': _PID,
+            'thread_id': thread_id,
+            'context': context,
         }
-        self._logger.log(level, message, extra=extra)
+        logger.log(level, message, extra=extra)
     
     def debug(
         self,
@@ -364,25 +525,28 @@ class Logger:
         context: Optional[dict[str, Any]] = None
     ) -> None:
         """Log an exception with stack trace."""
-        if exc:
-            self._logger.exception(
-                message,
-                exc_info=exc,
-                extra={
-                    'subsystem': self._subsystem,
-                    'pid': pid,
-                    'context': context or {},
-                }
+        if context is None:
+            context = _EMPTY
+        thread_id = _get_ident()
+        
+        kernel_handler = self._kernel_handler
+        if kernel_handler is not None and self._logger.isEnabledFor(logging.ERROR):
+            kernel_handler.fast_emit(
+                logging.getLevelName(logging.ERROR), message, self._subsystem,
+                pid, context, time.time(), _PID, thread_id
             )
+        
+        extra = {
+            'subsystem': self._subsystem,
+            'pid': pid,
+            'os_pid': _PID,
+            'thread_id': thread_id,
+            'context': context,
+        }
+        if exc:
+            self._logger.exception(message, exc_info=exc, extra=extra)
         else:
-            self._logger.exception(
-                message,
-                extra={
-                    'subsystem': self._subsystem,
-                    'pid': pid,
-                    'context': context or {},
-                }
-            )
+            self._logger.exception(message, extra=extra)
 
 
 def log_function_call(logger: Optional[Logger] = None):
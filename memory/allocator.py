@@ -10,11 +10,12 @@ Author: YSNRFD
 Version: 1.0.0
 """
 
+from array import array
 from dataclasses import dataclass
 from typing import Optional, Any, List
 import threading
 
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
 
 
 @dataclass
@@ -123,14 +124,15 @@ class BuddyAllocator:
             block.pid = pid
             self._allocated[block.address] = block
             
-            self._logger.debug(
-                f"Allocated block",
-                context={
-                    'address': hex(block.address),
-                    'size': block.size,
-                    'pid': pid
-                }
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Allocated block",
+                    context={
+                        'address': hex(block.address),
+                        'size': block.size,
+                        'pid': pid
+                    }
+                )
             
             return block.address
     
@@ -180,10 +182,11 @@ class BuddyAllocator:
             # Try to coalesce with buddy
             self._coalesce(block)
             
-            self._logger.debug(
-                f"Freed block",
-                context={'address': hex(address), 'size': block.size}
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Freed block",
+                    context={'address': hex(address), 'size': block.size}
+                )
             
             return True
     
@@ -268,22 +271,30 @@ class SlabAllocator:
     
     Reduces fragmentation for frequently allocated objects
     like process control blocks, inodes, etc.
+    
+    Free object indices live on a LIFO stack, so allocation and release
+    are O(1) and recently freed (cache-warm) objects are reused first.
+    When the stack runs dry the allocator grows by a batch of slabs whose
+    size doubles on each growth, up to ``max_grow`` slabs.
     """
     
-    def __init__(self, object_size: int, slab_size: int = 4096):
+    def __init__(self, object_size: int, slab_size: int = 4096, max_grow: int = 16):
         """
         Initialize a slab allocator.
         
         Args:
             object_size: Size of objects in this slab
             slab_size: Size of each slab (page)
+            max_grow: Maximum number of slabs added in one growth step
         """
         self._object_size = object_size
         self._slab_size = slab_size
         self._objects_per_slab = slab_size // object_size
+        self._max_grow = max_grow
+        self._grow_count = 1
         
         self._slabs: List[bytearray] = []
-        self._free_objects: List[int] = []  # Object indices
+        self._free_objects = array('I')  # Stack of free object indices
         self._used_count = 0
         
         self._lock = threading.Lock()
@@ -297,12 +308,19 @@ class SlabAllocator:
         slab = bytearray(self._slab_size)
         self._slabs.append(slab)
         
-        # Add all objects in this slab to free list
+        # Push this slab's objects so the lowest index is popped first
         slab_index = len(self._slabs) - 1
         base_index = slab_index * self._objects_per_slab
         
-        for i in range(self._objects_per_slab):
-            self._free_objects.append(base_index + i)
+        self._free_objects.extend(
+            range(base_index + self._objects_per_slab - 1, base_index - 1, -1)
+        )
+    
+    def _grow(self) -> None:
+        """Add a batch of slabs, doubling the batch size each time."""
+        for _ in range(self._grow_count):
+            self._allocate_slab()
+        self._grow_count = min(self._grow_count * 2, self._max_grow)
     
     def allocate(self) -> Optional[int]:
         """
@@ -313,13 +331,13 @@ class SlabAllocator:
         """
         with self._lock:
             if not self._free_objects:
-                # Try to allocate new slab
-                self._allocate_slab()
+                # Try to allocate new slabs
+                self._grow()
             
             if not self._free_objects:
                 return None
             
-            index = self._free_objects.pop(0)
+            index = self._free_objects.pop()
             self._used_count += 1
             
             return index
@@ -327,7 +345,7 @@ class SlabAllocator:
     def free(self, index: int) -> bool:
         """Free an object by its index."""
         with self._lock:
-            if index < 0:
+            if not 0 <= index < len(self._slabs) * self._objects_per_slab:
                 return False
             
             self._free_objects.append(index)
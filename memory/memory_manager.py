@@ -11,7 +11,6 @@ Author: YSNRFD
 Version: 1.0.0
 """
 
-import threading
 from typing import Optional, Any
 
 from .paging import PageTable, PageFlags, FrameAllocator
@@ -19,14 +18,73 @@ from .virtual_memory import AddressSpace, RegionType
 from .allocator import BuddyAllocator, SlabAllocator
 from pyos.core.registry import Subsystem, SubsystemState
 from pyos.core.config_loader import get_config
+from pyos.core.rwlock import RWLock
 from pyos.exceptions import (
+    BootFailureError,
     MemoryAllocationError,
     MemoryDeallocationError,
     OutOfMemoryError,
     MemoryProtectionError,
     SegmentationFault,
 )
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
+
+
+# Source for methods specialized on the page size. The page shift, page
+# mask and shard mask are formatted in as literals, so the generated code
+# loads them as constants instead of looking them up on every call.
+_SPECIALIZED_TEMPLATE = """
+def translate(self, virtual_address, pid=0):
+    lock, address_spaces, process_memory = self._shards[pid & {shard_mask}]
+    with lock.read:
+        addr_space = address_spaces.get(pid)
+        if not addr_space:
+            return None
+        
+        frame = addr_space.page_table.translate(virtual_address >> {page_shift})
+        if frame is None:
+            return None
+        
+        return (frame << {page_shift}) | (virtual_address & {page_mask})
+"""
+
+_specialized_classes: dict[tuple[type, int], type] = {}
+
+
+def _specialize(cls: type, page_size: int) -> type:
+    """
+    Build (or fetch from cache) a subclass of cls specialized for page_size.
+    
+    Args:
+        cls: Generic memory manager class
+        page_size: Page size in bytes, a power of two
+    
+    Returns:
+        Subclass whose hot paths use the page size as a constant
+    """
+    key = (cls, page_size)
+    specialized = _specialized_classes.get(key)
+    if specialized is None:
+        source = _SPECIALIZED_TEMPLATE.format(
+            page_shift=(page_size - 1).bit_length(),
+            page_mask=page_size - 1,
+            shard_mask=cls.NUM_SHARDS - 1
+        )
+        namespace: dict[str, Any] = {}
+        exec(compile(source, f"<{cls.__name__} page_size={page_size}>", "exec"), namespace)
+        
+        translate = namespace['translate']
+        translate.__doc__ = cls.translate.__doc__
+        translate.__qualname__ = f"{cls.__name__}.translate"
+        
+        specialized = type(cls.__name__, (cls,), {
+            '__module__': cls.__module__,
+            '__doc__': cls.__doc__,
+            '_generic_class': cls,
+            'translate': translate,
+        })
+        _specialized_classes[key] = specialized
+    return specialized
 
 
 class MemoryManager(Subsystem):
@@ -46,20 +104,29 @@ class MemoryManager(Subsystem):
         >>> addr = mm.allocate(1024, pid=1)
     """
     
+    NUM_SHARDS = 16  # Must be a power of two
+    
     def __init__(self):
         super().__init__('memory')
         self._total_memory: int = 0
         self._page_size: int = 0
+        self._page_shift: int = 0
+        self._page_mask: int = 0
         self._total_frames: int = 0
+        self._max_memory_per_process: int = 0
         
         self._frame_allocator: Optional[FrameAllocator] = None
         self._buddy_allocator: Optional[BuddyAllocator] = None
         self._slab_allocators: dict[str, SlabAllocator] = {}
         
-        self._address_spaces: dict[int, AddressSpace] = {}
-        self._process_memory: dict[int, int] = {}  # pid -> bytes allocated
-        
-        self._lock = threading.Lock()
+        # Per-process state is sharded by PID so unrelated processes don't
+        # contend. Each shard is (lock, address spaces, bytes allocated per
+        # pid). Readers (translation, stats, fault checks) share a shard's
+        # lock; anything that changes mappings or accounting takes it
+        # exclusively.
+        self._shards: list[tuple[RWLock, dict[int, AddressSpace], dict[int, int]]] = [
+            (RWLock(), {}, {}) for _ in range(self.NUM_SHARDS)
+        ]
     
     def initialize(self) -> None:
         """Initialize the memory manager."""
@@ -69,7 +136,21 @@ class MemoryManager(Subsystem):
         
         self._total_memory = config.memory.total_memory
         self._page_size = config.memory.page_size
-        self._total_frames = self._total_memory // self._page_size
+        if self._page_size <= 0 or self._page_size & (self._page_size - 1):
+            raise BootFailureError(
+                f"Page size must be a power of two: {self._page_size}",
+                subsystem="memory"
+            )
+        
+        # Page arithmetic uses shifts and masks instead of // and %
+        self._page_shift = (self._page_size - 1).bit_length()
+        self._page_mask = self._page_size - 1
+        self._total_frames = self._total_memory >> self._page_shift
+        self._max_memory_per_process = config.memory.max_memory_per_process
+        
+        # Swap in a class with the page size baked into its hot paths
+        generic = getattr(type(self), '_generic_class', type(self))
+        self.__class__ = _specialize(generic, self._page_size)
         
         # Initialize frame allocator
         self._frame_allocator = FrameAllocator(self._total_frames)
@@ -110,8 +191,19 @@ class MemoryManager(Subsystem):
     
     def cleanup(self) -> None:
         """Clean up memory manager resources."""
-        self._address_spaces.clear()
-        self._process_memory.clear()
+        for lock, address_spaces, process_memory in self._shards:
+            with lock.write:
+                address_spaces.clear()
+                process_memory.clear()
+    
+    def refresh_config(self) -> None:
+        """Re-read runtime-tunable limits from the configuration."""
+        config = get_config()
+        self._max_memory_per_process = config.memory.max_memory_per_process
+    
+    def _shard(self, pid: int) -> tuple[RWLock, dict[int, AddressSpace], dict[int, int]]:
+        """Get the shard holding a process's state."""
+        return self._shards[pid & (self.NUM_SHARDS - 1)]
     
     @property
     def total_memory(self) -> int:
@@ -127,7 +219,7 @@ class MemoryManager(Subsystem):
     def free_memory(self) -> int:
         """Get free memory in bytes."""
         if self._frame_allocator:
-            return self._frame_allocator.free_frames * self._page_size
+            return self._frame_allocator.free_frames << self._page_shift
         return 0
     
     @property
@@ -145,20 +237,27 @@ class MemoryManager(Subsystem):
         Returns:
             The new AddressSpace
         """
-        with self._lock:
-            if pid in self._address_spaces:
-                return self._address_spaces[pid]
-            
-            addr_space = AddressSpace(pid, self._page_size)
-            self._address_spaces[pid] = addr_space
-            self._process_memory[pid] = 0
-            
-            self._logger.debug(
-                "Created address space",
-                pid=pid
-            )
-            
+        lock = self._shard(pid)[0]
+        with lock.write:
+            return self._get_or_create_address_space(pid)
+    
+    def _get_or_create_address_space(self, pid: int) -> AddressSpace:
+        """Look up or create an address space. Caller holds the shard's write lock."""
+        _, address_spaces, process_memory = self._shard(pid)
+        addr_space = address_spaces.get(pid)
+        if addr_space:
             return addr_space
+        
+        addr_space = AddressSpace(pid, self._page_size)
+        address_spaces[pid] = addr_space
+        process_memory[pid] = 0
+        
+        self._logger.debug(
+            "Created address space",
+            pid=pid
+        )
+        
+        return addr_space
     
     def destroy_address_space(self, pid: int) -> None:
         """
@@ -167,19 +266,16 @@ class MemoryManager(Subsystem):
         Args:
             pid: Process ID
         """
-        with self._lock:
-            addr_space = self._address_spaces.pop(pid, None)
+        lock, address_spaces, process_memory = self._shard(pid)
+        with lock.write:
+            addr_space = address_spaces.pop(pid, None)
             
             if addr_space:
-                # Free all frames
-                page_table = addr_space.page_table
-                for page_num in page_table.get_all_pages():
-                    entry = page_table.get_entry(page_num)
-                    if entry:
-                        self._frame_allocator.free(entry.physical_frame)
+                # Free all frames in one batch
+                self._frame_allocator.free_many(addr_space.page_table.collect_frames())
                 
                 addr_space.clear()
-                self._process_memory.pop(pid, None)
+                process_memory.pop(pid, None)
                 
                 self._logger.debug(
                     "Destroyed address space",
@@ -190,7 +286,7 @@ class MemoryManager(Subsystem):
         self,
         size: int,
         pid: int = 0,
-        flags: PageFlags = PageFlags.PRESENT | PageFlags.WRITABLE | PageFlags.USER
+        flags: int = PageFlags.PRESENT | PageFlags.WRITABLE | PageFlags.USER
     ) -> int:
         """
         Allocate memory for a process.
@@ -207,74 +303,74 @@ class MemoryManager(Subsystem):
             MemoryAllocationError: If allocation fails
             OutOfMemoryError: If system is out of memory
         """
-        config = get_config()
+        lock, address_spaces, process_memory = self._shard(pid)
         
         # Check process memory limit
         if pid != 0:
-            current = self._process_memory.get(pid, 0)
-            if current + size > config.memory.max_memory_per_process:
+            current = process_memory.get(pid, 0)
+            if current + size > self._max_memory_per_process:
                 raise MemoryAllocationError(
                     f"Process memory limit exceeded",
                     size=size
                 )
         
         # Calculate pages needed
-        pages_needed = (size + self._page_size - 1) // self._page_size
+        pages_needed = (size + self._page_mask) >> self._page_shift
+        
+        # Fail fast without taking any lock; the free-frame count is a
+        # counter read, and reservation below re-checks atomically
+        if self._frame_allocator.free_frames < pages_needed:
+            raise OutOfMemoryError(
+                requested=size,
+                available=self.free_memory
+            )
         
-        with self._lock:
-            # Check if enough physical memory
-            if self._frame_allocator.free_frames < pages_needed:
+        with lock.write:
+            # Reserve all frames first: reservation is all-or-nothing, so a
+            # failure here leaves nothing to undo
+            frames = self._frame_allocator.allocate_many(pages_needed)
+            if frames is None:
                 raise OutOfMemoryError(
                     requested=size,
                     available=self.free_memory
                 )
             
             # Get address space
-            addr_space = self._address_spaces.get(pid)
-            if not addr_space:
-                addr_space = self.create_address_space(pid)
+            addr_space = self._get_or_create_address_space(pid)
             
             # Allocate region
             virtual_start = addr_space._heap_end
-            region = addr_space.add_region(
-                start=virtual_start,
-                size=pages_needed * self._page_size,
-                region_type=RegionType.HEAP,
-                flags=flags,
-                name="heap"
-            )
+            try:
+                addr_space.add_region(
+                    start=virtual_start,
+                    size=pages_needed << self._page_shift,
+                    region_type=RegionType.HEAP,
+                    flags=flags,
+                    name="heap"
+                )
+            except ValueError:
+                self._frame_allocator.free_many(frames)
+                raise
             
-            # Map pages
-            for i in range(pages_needed):
-                virtual_page = (virtual_start + i * self._page_size) // self._page_size
-                
-                frame = self._frame_allocator.allocate()
-                if frame is None:
-                    # Rollback
-                    for j in range(i):
-                        prev_page = (virtual_start + j * self._page_size) // self._page_size
-                        prev_entry = addr_space.page_table.get_entry(prev_page)
-                        if prev_entry:
-                            self._frame_allocator.free(prev_entry.physical_frame)
-                            addr_space.page_table.unmap_page(prev_page)
-                    raise OutOfMemoryError("Unexpected out of memory")
-                
-                addr_space.page_table.map_page(virtual_page, frame, flags)
+            addr_space.page_table.map_range(
+                virtual_start >> self._page_shift, frames, flags
+            )
             
             # Update process memory usage
-            actual_size = pages_needed * self._page_size
-            self._process_memory[pid] = self._process_memory.get(pid, 0) + actual_size
+            actual_size = pages_needed << self._page_shift
+            process_memory[pid] = process_memory.get(pid, 0) + actual_size
             addr_space._heap_end = virtual_start + actual_size
             
-            self._logger.debug(
-                f"Allocated memory",
-                pid=pid,
-                context={
-                    'address': hex(virtual_start),
-                    'size': actual_size,
-                    'pages': pages_needed
-                }
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Allocated memory",
+                    pid=pid,
+                    context={
+                        'address': hex(virtual_start),
+                        'size': actual_size,
+                        'pages': pages_needed
+                    }
+                )
             
             return virtual_start
     
@@ -289,8 +385,9 @@ class MemoryManager(Subsystem):
         Raises:
             MemoryDeallocationError: If deallocation fails
         """
-        with self._lock:
-            addr_space = self._address_spaces.get(pid)
+        lock, address_spaces, process_memory = self._shard(pid)
+        with lock.write:
+            addr_space = address_spaces.get(pid)
             if not addr_space:
                 raise MemoryDeallocationError(
                     "Address space not found",
@@ -306,34 +403,36 @@ class MemoryManager(Subsystem):
                 )
             
             # Unmap pages
-            start_page = region.start // self._page_size
-            num_pages = region.size // self._page_size
+            start_page = region.start >> self._page_shift
+            num_pages = region.size >> self._page_shift
             
-            for i in range(num_pages):
-                page_num = start_page + i
-                entry = addr_space.page_table.get_entry(page_num)
-                
+            unmap_page = addr_space.page_table.unmap_page
+            freed = []
+            append = freed.append
+            for page_num in range(start_page, start_page + num_pages):
+                entry = unmap_page(page_num)
                 if entry:
-                    self._frame_allocator.free(entry.physical_frame)
-                    addr_space.page_table.unmap_page(page_num)
+                    append(entry.physical_frame)
+            self._frame_allocator.free_many(freed)
             
             # Remove region
             addr_space.remove_region(region.start)
             
             # Update process memory
-            self._process_memory[pid] = self._process_memory.get(pid, 0) - region.size
+            process_memory[pid] = process_memory.get(pid, 0) - region.size
             
-            self._logger.debug(
-                f"Freed memory",
-                pid=pid,
-                context={'address': hex(address), 'size': region.size}
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Freed memory",
+                    pid=pid,
+                    context={'address': hex(address), 'size': region.size}
+                )
     
     def protect(
         self,
         address: int,
         size: int,
-        flags: PageFlags,
+        flags: int,
         pid: int = 0
     ) -> None:
         """
@@ -348,8 +447,9 @@ class MemoryManager(Subsystem):
         Raises:
             MemoryProtectionError: If protection change fails
         """
-        with self._lock:
-            addr_space = self._address_spaces.get(pid)
+        lock, address_spaces, process_memory = self._shard(pid)
+        with lock.write:
+            addr_space = address_spaces.get(pid)
             if not addr_space:
                 raise MemoryProtectionError(
                     "Address space not found",
@@ -366,17 +466,17 @@ class MemoryManager(Subsystem):
             region.flags = flags
             
             # Update page table entries
-            start_page = address // self._page_size
-            num_pages = (size + self._page_size - 1) // self._page_size
+            start_page = address >> self._page_shift
+            num_pages = (size + self._page_mask) >> self._page_shift
             
-            for i in range(num_pages):
-                addr_space.page_table.update_flags(start_page + i, flags)
+            addr_space.page_table.update_flags_range(start_page, num_pages, flags)
             
-            self._logger.debug(
-                f"Changed memory protection",
-                pid=pid,
-                context={'address': hex(address), 'flags': str(flags)}
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Changed memory protection",
+                    pid=pid,
+                    context={'address': hex(address), 'flags': PageFlags.describe(flags)}
+                )
     
     def translate(
         self,
@@ -393,18 +493,20 @@ class MemoryManager(Subsystem):
         Returns:
             Physical address or None if not mapped
         """
-        addr_space = self._address_spaces.get(pid)
-        if not addr_space:
-            return None
-        
-        page_num = virtual_address // self._page_size
-        offset = virtual_address % self._page_size
-        
-        frame = addr_space.page_table.translate(page_num)
-        if frame is None:
-            return None
-        
-        return frame * self._page_size + offset
+        lock, address_spaces, process_memory = self._shard(pid)
+        with lock.read:
+            addr_space = address_spaces.get(pid)
+            if not addr_space:
+                return None
+            
+            page_num = virtual_address >> self._page_shift
+            offset = virtual_address & self._page_mask
+            
+            frame = addr_space.page_table.translate(page_num)
+            if frame is None:
+                return None
+            
+            return (frame << self._page_shift) | offset
     
     def handle_page_fault(
         self,
@@ -423,39 +525,48 @@ class MemoryManager(Subsystem):
         Returns:
             True if fault handled, False if segfault
         """
-        addr_space = self._address_spaces.get(pid)
-        if not addr_space:
-            self._logger.warning(
-                f"Page fault: no address space",
-                pid=pid,
-                context={'address': hex(virtual_address)}
-            )
-            return False
-        
-        region = addr_space.find_region(virtual_address)
-        if not region:
-            self._logger.warning(
-                f"Page fault: no region",
-                pid=pid,
-                context={'address': hex(virtual_address)}
-            )
-            return False
-        
-        # Check permissions
-        if access_type == "write" and PageFlags.WRITABLE not in region.flags:
-            self._logger.warning(
-                f"Page fault: write to read-only",
-                pid=pid,
-                context={'address': hex(virtual_address)}
-            )
-            return False
-        
-        # Page should be allocated, this shouldn't happen
-        page_num = virtual_address // self._page_size
-        entry = addr_space.page_table.get_entry(page_num)
-        
-        if entry is None:
-            # Need to allocate a frame
+        lock, address_spaces, process_memory = self._shard(pid)
+        with lock.read:
+            addr_space = address_spaces.get(pid)
+            if not addr_space:
+                self._logger.warning(
+                    f"Page fault: no address space",
+                    pid=pid,
+                    context={'address': hex(virtual_address)}
+                )
+                return False
+            
+            region = addr_space.find_region(virtual_address)
+            if not region:
+                self._logger.warning(
+                    f"Page fault: no region",
+                    pid=pid,
+                    context={'address': hex(virtual_address)}
+                )
+                return False
+            
+            # Check permissions
+            if access_type == "write" and not region.flags & PageFlags.WRITABLE:
+                self._logger.warning(
+                    f"Page fault: write to read-only",
+                    pid=pid,
+                    context={'address': hex(virtual_address)}
+                )
+                return False
+            
+            # Page should be allocated, this shouldn't happen
+            page_num = virtual_address >> self._page_shift
+            if addr_space.page_table.get_entry(page_num) is not None:
+                return True
+        
+        # Need to allocate a frame: retake the lock exclusively and re-check,
+        # since the mapping may have changed while it was released
+        with lock.write:
+            if address_spaces.get(pid) is not addr_space:
+                return False
+            if addr_space.page_table.get_entry(page_num) is not None:
+                return True
+            
             frame = self._frame_allocator.allocate()
             if frame is None:
                 self._logger.error(f"Out of memory during page fault")
@@ -463,8 +574,6 @@ class MemoryManager(Subsystem):
             
             addr_space.page_table.map_page(page_num, frame, region.flags)
             return True
-        
-        return True
     
     def allocate_kernel(self, size: int) -> Optional[int]:
         """
@@ -498,12 +607,17 @@ class MemoryManager(Subsystem):
     
     def get_process_memory_usage(self, pid: int) -> int:
         """Get memory usage for a process."""
-        return self._process_memory.get(pid, 0)
+        lock, _, process_memory = self._shard(pid)
+        with lock.read:
+            return process_memory.get(pid, 0)
     
     def get_stats(self) -> dict[str, Any]:
         """Get memory manager statistics."""
         buddy_stats = self._buddy_allocator.get_stats() if self._buddy_allocator else {}
         
+        # Shard sizes are read without locking; the total is a snapshot
+        num_address_spaces = sum(len(shard[1]) for shard in self._shards)
+        
         return {
             'total': self._total_memory,
             'used': self.used_memory,
@@ -513,19 +627,21 @@ class MemoryManager(Subsystem):
             'total_frames': self._total_frames,
             'free_frames': self._frame_allocator.free_frames 
                           if self._frame_allocator else 0,
-            'address_spaces': len(self._address_spaces),
+            'address_spaces': num_address_spaces,
             'kernel_allocator': buddy_stats,
         }
     
     def get_process_stats(self, pid: int) -> Optional[dict[str, Any]]:
         """Get memory statistics for a process."""
-        addr_space = self._address_spaces.get(pid)
-        if not addr_space:
-            return None
-        
-        return {
-            'pid': pid,
-            'total_allocated': self._process_memory.get(pid, 0),
-            'regions': addr_space.get_layout(),
-            'page_table': addr_space.page_table.get_stats()
-        }
+        lock, address_spaces, process_memory = self._shard(pid)
+        with lock.read:
+            addr_space = address_spaces.get(pid)
+            if not addr_space:
+                return None
+            
+            return {
+                'pid': pid,
+                'total_allocated': process_memory.get(pid, 0),
+                'regions': addr_space.get_layout(),
+                'page_table': addr_space.page_table.get_stats()
+            }
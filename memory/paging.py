@@ -11,16 +11,27 @@ Author: YSNRFD
 Version: 1.0.0
 """
 
+import re
+import sys
+import threading
+import weakref
+from array import array
 from dataclasses import dataclass, field
-from enum import Enum, Flag, auto
-from typing import Optional, Any, List
+from enum import Enum, auto
+from typing import Optional, Any, Iterator, List
 from collections import defaultdict
 
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
 
 
-class PageFlags(Flag):
-    """Page table entry flags."""
+class PageFlags:
+    """
+    Page table entry flags.
+    
+    Plain integer bit constants rather than an ``enum.Flag``: flag values
+    are combined and tested with ``|`` and ``&`` on ints, which avoids
+    enum construction and decomposition on every page table operation.
+    """
     PRESENT = 1       # Page is in memory
     WRITABLE = 2      # Page can be written
     USER = 4          # User-mode access allowed
@@ -28,27 +39,78 @@ class PageFlags(Flag):
     DIRTY = 16        # Page has been written to
     EXECUTABLE = 32   # Page can be executed
     COPY_ON_WRITE = 64  # Copy-on-write flag
+    
+    @classmethod
+    def describe(cls, flags: int) -> str:
+        """Render a flag value as ``NAME|NAME`` for display."""
+        names = [
+            name for name, bit in (
+                ('PRESENT', cls.PRESENT),
+                ('WRITABLE', cls.WRITABLE),
+                ('USER', cls.USER),
+                ('ACCESSED', cls.ACCESSED),
+                ('DIRTY', cls.DIRTY),
+                ('EXECUTABLE', cls.EXECUTABLE),
+                ('COPY_ON_WRITE', cls.COPY_ON_WRITE),
+            )
+            if flags & bit
+        ]
+        return "|".join(names) if names else "0"
+
+
+# Packed page table entry layout: bits 0-31 frame, bits 32-39 flags.
+# Unmapped slots hold -1, whose flag byte (0xFF) is never a valid value.
+_FRAME_MASK = 0xFFFFFFFF
+_FLAGS_SHIFT = 32
+_PRESENT_BIT = PageFlags.PRESENT << _FLAGS_SHIFT
+_UNMAPPED = -1
 
+# Radix split of a virtual page number into directory and leaf index
+_LEAF_BITS = 9
+_LEAF_SIZE = 1 << _LEAF_BITS
+_LEAF_MASK = _LEAF_SIZE - 1
+_EMPTY_LEAF = array('q', [_UNMAPPED]) * _LEAF_SIZE
 
-@dataclass
+# Matches the first byte of the frame bitmap with a clear bit
+_NOT_FULL_BYTE = re.compile(rb'[^\xff]')
+
+# Software TLB: direct-mapped, indexed by the low bits of the virtual page
+# Each slot holds a (virtual page, frame) pair, replaced as one object so
+# concurrent readers filling the TLB never see a torn tag/frame pair
+_TLB_SIZE = 64
+_TLB_MASK = _TLB_SIZE - 1
+_TLB_EMPTY = (-1, 0)
+
+# Offset of the flag byte inside each 8-byte entry, and translation
+# tables turning a flag byte into 0/1 for the bit of interest
+_FLAGS_BYTE = 4 if sys.byteorder == 'little' else 3
+_PRESENT_TABLE = bytes(
+    1 if b != 0xFF and b & PageFlags.PRESENT else 0 for b in range(256)
+)
+_DIRTY_TABLE = bytes(
+    1 if b != 0xFF and b & PageFlags.DIRTY else 0 for b in range(256)
+)
+
+
+@dataclass(slots=True)
 class Page:
     """A single memory page."""
     page_number: int
     frame_number: int
-    flags: PageFlags = PageFlags(0)
+    flags: int = 0
     ref_count: int = 0
     
     def is_present(self) -> bool:
-        return PageFlags.PRESENT in self.flags
+        return bool(self.flags & PageFlags.PRESENT)
     
     def is_writable(self) -> bool:
-        return PageFlags.WRITABLE in self.flags
+        return bool(self.flags & PageFlags.WRITABLE)
     
     def is_user_accessible(self) -> bool:
-        return PageFlags.USER in self.flags
+        return bool(self.flags & PageFlags.USER)
     
     def is_dirty(self) -> bool:
-        return PageFlags.DIRTY in self.flags
+        return bool(self.flags & PageFlags.DIRTY)
     
     def set_present(self, present: bool = True) -> None:
         if present:
@@ -63,13 +125,12 @@ class Page:
             self.flags &= ~PageFlags.DIRTY
 
 
-@dataclass
+@dataclass(slots=True)
 class PageTableEntry:
     """Entry in a page table."""
     virtual_page: int
     physical_frame: int
-    flags: PageFlags
-    last_accessed: float = 0.0
+    flags: int
 
 
 class PageTable:
@@ -77,149 +138,632 @@ class PageTable:
     A page table for a single process.
     
     Maps virtual page numbers to physical frame numbers.
-    Uses a two-level page table structure for efficiency.
+    Uses a two-level page table structure for efficiency: a directory
+    keyed by the high bits of the virtual page holds 512-entry leaves of
+    packed 64-bit entries, so no Python object is kept per mapped page.
+    ``PageTableEntry`` objects are only built on demand.
+    
+    Successful translations are cached in a small direct-mapped software
+    TLB; any change to a mapping invalidates its slot.
     """
     
     def __init__(self, page_size: int = 4096):
         self._page_size = page_size
-        self._entries: dict[int, PageTableEntry] = {}
+        self._dirs: dict[int, array] = {}
+        self._count = 0
+        self._tlb: List[tuple[int, int]] = [_TLB_EMPTY] * _TLB_SIZE
+        self._tlb_hits = 0
+        self._tlb_misses = 0
         self._logger = get_logger('page_table')
     
     @property
     def page_size(self) -> int:
         return self._page_size
     
+    def _invalidate(self, virtual_page: int) -> None:
+        """Drop a virtual page from the TLB."""
+        slot = virtual_page & _TLB_MASK
+        if self._tlb[slot][0] == virtual_page:
+            self._tlb[slot] = _TLB_EMPTY
+    
+    def _invalidate_range(self, start_page: int, count: int) -> None:
+        """Drop a range of virtual pages from the TLB."""
+        if count >= _TLB_SIZE:
+            self._tlb = [_TLB_EMPTY] * _TLB_SIZE
+            return
+        for virtual_page in range(start_page, start_page + count):
+            self._invalidate(virtual_page)
+    
+    @staticmethod
+    def _unpack(virtual_page: int, entry: int) -> PageTableEntry:
+        """Build a PageTableEntry from a packed entry."""
+        return PageTableEntry(
+            virtual_page=virtual_page,
+            physical_frame=entry & _FRAME_MASK,
+            flags=entry >> _FLAGS_SHIFT
+        )
+    
     def map_page(
         self,
         virtual_page: int,
         physical_frame: int,
-        flags: PageFlags = PageFlags.PRESENT | PageFlags.WRITABLE | PageFlags.USER
+        flags: int = PageFlags.PRESENT | PageFlags.WRITABLE | PageFlags.USER
     ) -> None:
         """Map a virtual page to a physical frame."""
-        self._entries[virtual_page] = PageTableEntry(
-            virtual_page=virtual_page,
-            physical_frame=physical_frame,
-            flags=flags
-        )
+        leaf = self._dirs.get(virtual_page >> _LEAF_BITS)
+        if leaf is None:
+            leaf = self._dirs[virtual_page >> _LEAF_BITS] = array('q', _EMPTY_LEAF)
         
-        self._logger.debug(
-            f"Mapped page",
-            context={
-                'virtual_page': virtual_page,
-                'physical_frame': physical_frame,
-                'flags': str(flags)
-            }
-        )
+        index = virtual_page & _LEAF_MASK
+        if leaf[index] == _UNMAPPED:
+            self._count += 1
+        leaf[index] = physical_frame | (flags << _FLAGS_SHIFT)
+        self._invalidate(virtual_page)
+        
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Mapped page",
+                context={
+                    'virtual_page': virtual_page,
+                    'physical_frame': physical_frame,
+                    'flags': PageFlags.describe(flags)
+                }
+            )
+    
+    def map_range(
+        self,
+        start_page: int,
+        frames: List[int],
+        flags: int = PageFlags.PRESENT | PageFlags.WRITABLE | PageFlags.USER
+    ) -> None:
+        """Map consecutive virtual pages to the given physical frames."""
+        dirs = self._dirs
+        flag_bits = flags << _FLAGS_SHIFT
+        page = start_page
+        done = 0
+        total = len(frames)
+        
+        # Fill one leaf slice per iteration
+        while done < total:
+            leaf = dirs.get(page >> _LEAF_BITS)
+            if leaf is None:
+                leaf = dirs[page >> _LEAF_BITS] = array('q', _EMPTY_LEAF)
+            
+            lo = page & _LEAF_MASK
+            hi = min(_LEAF_SIZE, lo + total - done)
+            self._count += leaf[lo:hi].count(_UNMAPPED)
+            leaf[lo:hi] = array(
+                'q', [frame | flag_bits for frame in frames[done:done + hi - lo]]
+            )
+            
+            done += hi - lo
+            page += hi - lo
+        
+        self._invalidate_range(start_page, total)
+        
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Mapped page range",
+                context={
+                    'start_page': start_page,
+                    'pages': total,
+                    'flags': PageFlags.describe(flags)
+                }
+            )
     
     def unmap_page(self, virtual_page: int) -> Optional[PageTableEntry]:
         """Unmap a virtual page."""
-        return self._entries.pop(virtual_page, None)
+        leaf = self._dirs.get(virtual_page >> _LEAF_BITS)
+        if leaf is None:
+            return None
+        
+        index = virtual_page & _LEAF_MASK
+        entry = leaf[index]
+        if entry == _UNMAPPED:
+            return None
+        
+        leaf[index] = _UNMAPPED
+        self._count -= 1
+        self._invalidate(virtual_page)
+        
+        # Drop leaves that no longer map anything
+        if leaf == _EMPTY_LEAF:
+            del self._dirs[virtual_page >> _LEAF_BITS]
+        
+        return self._unpack(virtual_page, entry)
     
     def get_entry(self, virtual_page: int) -> Optional[PageTableEntry]:
         """Get the page table entry for a virtual page."""
-        return self._entries.get(virtual_page)
+        leaf = self._dirs.get(virtual_page >> _LEAF_BITS)
+        if leaf is None:
+            return None
+        entry = leaf[virtual_page & _LEAF_MASK]
+        if entry == _UNMAPPED:
+            return None
+        return self._unpack(virtual_page, entry)
     
     def translate(self, virtual_page: int) -> Optional[int]:
         """Translate a virtual page to a physical frame."""
-        entry = self._entries.get(virtual_page)
-        if entry and PageFlags.PRESENT in entry.flags:
-            return entry.physical_frame
+        slot = virtual_page & _TLB_MASK
+        cached = self._tlb[slot]
+        if cached[0] == virtual_page:
+            self._tlb_hits += 1
+            return cached[1]
+        
+        self._tlb_misses += 1
+        leaf = self._dirs.get(virtual_page >> _LEAF_BITS)
+        if leaf is not None:
+            entry = leaf[virtual_page & _LEAF_MASK]
+            if entry != _UNMAPPED and entry & _PRESENT_BIT:
+                frame = entry & _FRAME_MASK
+                self._tlb[slot] = (virtual_page, frame)
+                return frame
         return None
     
-    def update_flags(self, virtual_page: int, flags: PageFlags) -> bool:
+    def update_flags(self, virtual_page: int, flags: int) -> bool:
         """Update flags for a page."""
-        entry = self._entries.get(virtual_page)
-        if entry:
-            entry.flags = flags
-            return True
-        return False
+        leaf = self._dirs.get(virtual_page >> _LEAF_BITS)
+        if leaf is None:
+            return False
+        index = virtual_page & _LEAF_MASK
+        entry = leaf[index]
+        if entry == _UNMAPPED:
+            return False
+        leaf[index] = (entry & _FRAME_MASK) | (flags << _FLAGS_SHIFT)
+        self._invalidate(virtual_page)
+        return True
+    
+    def update_flags_range(self, start_page: int, count: int, flags: int) -> int:
+        """
+        Update flags for a range of pages, skipping unmapped ones.
+        
+        Returns:
+            Number of pages updated
+        """
+        dirs = self._dirs
+        flag_bits = flags << _FLAGS_SHIFT
+        page = start_page
+        end = start_page + count
+        updated = 0
+        
+        # Rewrite one leaf slice per iteration
+        while page < end:
+            lo = page & _LEAF_MASK
+            hi = min(_LEAF_SIZE, lo + end - page)
+            leaf = dirs.get(page >> _LEAF_BITS)
+            if leaf is not None:
+                old = leaf[lo:hi]
+                leaf[lo:hi] = array('q', [
+                    entry if entry == _UNMAPPED
+                    else (entry & _FRAME_MASK) | flag_bits
+                    for entry in old
+                ])
+                updated += (hi - lo) - old.count(_UNMAPPED)
+            page += hi - lo
+        
+        self._invalidate_range(start_page, count)
+        return updated
+    
+    def iter_pages(self) -> Iterator[tuple[int, int]]:
+        """Iterate over ``(virtual page, physical frame)`` for every mapping."""
+        for key, leaf in list(self._dirs.items()):
+            base = key << _LEAF_BITS
+            for index, entry in enumerate(leaf):
+                if entry != _UNMAPPED:
+                    yield base | index, entry & _FRAME_MASK
+    
+    def collect_frames(self) -> array:
+        """Get the physical frames of every mapping as an ``array('Q')``."""
+        frames = array('Q')
+        for leaf in self._dirs.values():
+            frames.extend([entry & _FRAME_MASK for entry in leaf if entry != _UNMAPPED])
+        return frames
     
     def get_all_pages(self) -> List[int]:
         """Get all mapped virtual page numbers."""
-        return list(self._entries.keys())
+        return [page for page, _ in self.iter_pages()]
     
     def get_stats(self) -> dict[str, Any]:
         """Get page table statistics."""
-        present = sum(1 for e in self._entries.values() 
-                     if PageFlags.PRESENT in e.flags)
-        dirty = sum(1 for e in self._entries.values() 
-                   if PageFlags.DIRTY in e.flags)
+        # Pull the flag byte out of every entry and count bits in C
+        present = 0
+        dirty = 0
+        for leaf in self._dirs.values():
+            flag_bytes = leaf.tobytes()[_FLAGS_BYTE::8]
+            present += flag_bytes.translate(_PRESENT_TABLE).count(1)
+            dirty += flag_bytes.translate(_DIRTY_TABLE).count(1)
         
         return {
-            'total_pages': len(self._entries),
+            'total_pages': self._count,
             'present_pages': present,
             'dirty_pages': dirty,
-            'memory_used': len(self._entries) * self._page_size
+            'memory_used': self._count * self._page_size,
+            'tlb_hits': self._tlb_hits,
+            'tlb_misses': self._tlb_misses,
         }
     
     def clear(self) -> None:
         """Clear all mappings."""
-        self._entries.clear()
+        self._dirs.clear()
+        self._count = 0
+        self._tlb = [_TLB_EMPTY] * _TLB_SIZE
+
+
+class _MagazineHolder:
+    """
+    Thread-local owner of a frame magazine.
+    
+    Dropped along with the thread's locals when the thread exits, which
+    lets the allocator take the magazine's frames back.
+    """
+    
+    __slots__ = ('magazine', '__weakref__')
+    
+    def __init__(self, magazine: List[int]):
+        self.magazine = magazine
 
 
 class FrameAllocator:
     """
     Physical frame allocator.
     
-    Manages allocation of physical memory frames using a bitmap.
+    Manages allocation of physical memory frames using a bitmap with one
+    bit per frame, stored in a ``bytearray`` and scanned as 64-bit words. Searching skips full words
+    in one comparison and locates the free bit within a word with bit
+    arithmetic rather than probing frame by frame.
+    
+    Single-frame ``allocate``/``free`` go through a per-thread magazine of
+    reserved frames, refilled and drained in batches, so most calls never
+    take the allocator lock. Frames sitting in magazines count as free;
+    they stay set in the bitmap and are recorded in ``_parked``, which
+    makes the double-free check O(1). A thread's magazine is handed back
+    to the bitmap when the thread exits.
     """
     
+    WORD_BITS = 64
+    FULL_WORD = (1 << 64) - 1
+    MAGAZINE_SIZE = 64    # Frames reserved per refill
+    MAGAZINE_LIMIT = 128  # Drain half the magazine back above this
+    
     def __init__(self, total_frames: int):
         self._total_frames = total_frames
-        self._allocated: set[int] = set()
+        self._num_words = (total_frames + 63) >> 6
+        # One bit per frame in a flat buffer (total_frames / 8 bytes),
+        # addressed as native 64-bit words through a memoryview
+        self._bits = bytearray(self._num_words * 8)
+        self._bitmap = memoryview(self._bits).cast('Q')
+        self._free_count = total_frames
         self._next_frame = 0
-        self._lock = None  # Will be set to threading.Lock on first use
+        self._lock = threading.Lock()
+        
+        # Per-thread magazines, plus every live magazine so they can be
+        # reclaimed
+        self._tls = threading.local()
+        self._magazines: List[List[int]] = []
+        
+        # Frames sitting in a magazine. dict.setdefault is atomic, so it is
+        # the lock-free test-and-set that decides which caller parks a
+        # frame; a frame is parked before it enters a magazine and unparked
+        # only after it leaves one.
+        self._parked: dict[int, object] = {}
+        
+        # Mark the padding bits past the last frame as permanently in use
+        tail = total_frames & 63
+        if tail:
+            self._bitmap[-1] = self.FULL_WORD ^ ((1 << tail) - 1)
+    
+    def _magazine(self) -> List[int]:
+        """Get the calling thread's magazine, creating it if necessary."""
+        holder = getattr(self._tls, 'holder', None)
+        if holder is None:
+            holder = self._tls.holder = _MagazineHolder([])
+            with self._lock:
+                self._magazines.append(holder.magazine)
+            weakref.finalize(
+                holder, FrameAllocator._retire, weakref.ref(self), holder.magazine
+            )
+        return holder.magazine
+    
+    @staticmethod
+    def _retire(allocator_ref: 'weakref.ref[FrameAllocator]', magazine: List[int]) -> None:
+        """Return an exited thread's magazine to the bitmap and drop it."""
+        allocator = allocator_ref()
+        if allocator is None:
+            return
+        with allocator._lock:
+            allocator._drain(magazine)
+            allocator._magazines = [
+                other for other in allocator._magazines if other is not magazine
+            ]
+    
+    def _drain(self, magazine: List[int]) -> None:
+        """
+        Return every frame in a magazine to the bitmap.
+        
+        Must be called with the lock held. Only atomic list operations
+        touch the magazine, so its owner may keep using it concurrently.
+        """
+        frames = []
+        while True:
+            try:
+                frames.append(magazine.pop())
+            except IndexError:
+                break
+        self._unpark(frames)
+    
+    def _unpark(self, frames: List[int]) -> None:
+        """
+        Release parked frames to the bitmap.
+        
+        Must be called with the lock held. The bits are cleared before the
+        frames are unparked, so a concurrent free never sees a frame that
+        is both unparked and still set.
+        """
+        self._release(frames)
+        parked = self._parked
+        for frame in frames:
+            parked.pop(frame, None)
+    
+    def _take(self, count: int) -> List[int]:
+        """
+        Claim up to ``count`` clear bits from the bitmap.
+        
+        Must be called with the lock held.
+        """
+        count = min(count, self._free_count)
+        frames: List[int] = []
+        if count <= 0:
+            return frames
+        
+        bitmap = self._bitmap
+        full = self.FULL_WORD
+        search = _NOT_FULL_BYTE.search
+        bits = self._bits
+        append = frames.append
+        pos = (self._next_frame >> 6) << 3
+        
+        while True:
+            # Skip full words with a C-level scan of the raw buffer,
+            # wrapping around once the end is reached
+            match = search(bits, pos) or search(bits)
+            word_idx = match.start() >> 3
+            
+            # Peel off the lowest clear bit until the word is full
+            word = bitmap[word_idx]
+            base = word_idx << 6
+            clear = ~word & full
+            while clear:
+                low = clear & -clear
+                append(base | (low.bit_length() - 1))
+                word |= low
+                if len(frames) == count:
+                    break
+                clear ^= low
+            bitmap[word_idx] = word
+            if len(frames) == count:
+                break
+            pos = (word_idx + 1) << 3
+        
+        self._free_count -= count
+        self._next_frame = (frames[-1] + 1) % self._total_frames
+        return frames
+    
+    def _release(self, frames) -> int:
+        """
+        Clear the bits of allocated frames.
+        
+        Must be called with the lock held. Returns the number released.
+        """
+        total = self._total_frames
+        bitmap = self._bitmap
+        released = 0
+        for frame in frames:
+            if not 0 <= frame < total:
+                continue
+            word_idx = frame >> 6
+            mask = 1 << (frame & 63)
+            word = bitmap[word_idx]
+            if word & mask:
+                bitmap[word_idx] = word & ~mask
+                released += 1
+        self._free_count += released
+        return released
     
-    def _get_lock(self):
-        """Get the lock, creating it if necessary."""
-        import threading
-        if self._lock is None:
-            self._lock = threading.Lock()
-        return self._lock
+    def _reclaim(self) -> None:
+        """
+        Return every magazine's frames to the bitmap.
+        
+        Must be called with the lock held.
+        """
+        for magazine in self._magazines:
+            self._drain(magazine)
     
     def allocate(self) -> Optional[int]:
         """Allocate a physical frame."""
-        with self._get_lock():
-            if len(self._allocated) >= self._total_frames:
+        magazine = self._magazine()
+        try:
+            frame = magazine.pop()
+        except IndexError:
+            pass
+        else:
+            self._parked.pop(frame, None)
+            return frame
+        
+        with self._lock:
+            frames = self._take(self.MAGAZINE_SIZE)
+            if not frames:
+                self._reclaim()
+                frames = self._take(self.MAGAZINE_SIZE)
+                if not frames:
+                    return None
+            frame = frames.pop()
+            self._parked.update(dict.fromkeys(frames, magazine))
+        
+        magazine.extend(frames)
+        return frame
+    
+    def allocate_many(self, count: int) -> Optional[List[int]]:
+        """
+        Allocate several frames in one locked pass.
+        
+        The frames need not be contiguous. Allocation is all-or-nothing.
+        
+        Args:
+            count: Number of frames to allocate
+        
+        Returns:
+            List of frame numbers, or None if not enough frames are free
+        """
+        if count <= 0:
+            return []
+        
+        with self._lock:
+            if self._free_count < count:
+                self._reclaim()
+                if self._free_count < count:
+                    return None
+            return self._take(count)
+    
+    def allocate_contiguous(self, count: int) -> Optional[int]:
+        """
+        Allocate a run of physically contiguous frames.
+        
+        Args:
+            count: Number of frames in the run
+        
+        Returns:
+            First frame of the run, or None if no free run is long enough
+        """
+        if count <= 0:
+            return None
+        
+        with self._lock:
+            # Magazines may hold frames that would complete a run
+            self._reclaim()
+            if self._free_count < count:
                 return None
             
-            # Find a free frame
-            frame = self._next_frame
-            attempts = 0
+            bitmap = self._bitmap
+            full = self.FULL_WORD
+            run_start = 0
+            run_len = 0
             
-            while frame in self._allocated and attempts < self._total_frames:
-                frame = (frame + 1) % self._total_frames
-                attempts += 1
-            
-            if attempts >= self._total_frames:
+            for word_idx in range(self._num_words):
+                word = bitmap[word_idx]
+                base = word_idx << 6
+                if word == 0:
+                    if run_len == 0:
+                        run_start = base
+                    run_len += 64
+                elif word == full:
+                    run_len = 0
+                    continue
+                else:
+                    for bit in range(64):
+                        if (word >> bit) & 1:
+                            run_len = 0
+                            continue
+                        if run_len == 0:
+                            run_start = base | bit
+                        run_len += 1
+                        if run_len >= count:
+                            break
+                if run_len >= count:
+                    break
+            else:
                 return None
             
-            self._allocated.add(frame)
-            self._next_frame = (frame + 1) % self._total_frames
+            # Mark the run word by word
+            frame = run_start
+            end = run_start + count
+            while frame < end:
+                bit = frame & 63
+                width = min(64 - bit, end - frame)
+                bitmap[frame >> 6] |= ((1 << width) - 1) << bit
+                frame += width
             
-            return frame
+            self._free_count -= count
+            return run_start
     
     def free(self, frame: int) -> bool:
         """Free a physical frame."""
-        with self._get_lock():
-            if frame in self._allocated:
-                self._allocated.remove(frame)
-                return True
+        if not 0 <= frame < self._total_frames:
             return False
+        
+        bitmap = self._bitmap
+        word_idx = frame >> 6
+        mask = 1 << (frame & 63)
+        if not bitmap[word_idx] & mask:
+            return False
+        
+        # Exactly one caller parks the frame; any other free of it fails
+        parked = self._parked
+        magazine = self._magazine()
+        token = object()
+        if parked.setdefault(frame, token) is not token:
+            return False
+        if not bitmap[word_idx] & mask:
+            # Released to the bitmap between the check and the park
+            del parked[frame]
+            return False
+        magazine.append(frame)
+        
+        if len(magazine) > self.MAGAZINE_LIMIT:
+            # Only the owner and the lock holder modify it
+            with self._lock:
+                half = self.MAGAZINE_LIMIT // 2
+                excess = magazine[:half]
+                del magazine[:half]
+                self._unpark(excess)
+        return True
+    
+    def free_many(self, frames) -> int:
+        """
+        Free several frames in one locked pass.
+        
+        Args:
+            frames: Iterable of frame numbers
+        
+        Returns:
+            Number of frames actually freed
+        """
+        with self._lock:
+            # Frames parked in magazines are already free; holding the park
+            # while the bits are cleared keeps a concurrent free out
+            parked = self._parked
+            token = object()
+            owned = [
+                frame for frame in frames
+                if parked.setdefault(frame, token) is token
+            ]
+            released = self._release(owned)
+            for frame in owned:
+                parked.pop(frame, None)
+            return released
     
     def is_allocated(self, frame: int) -> bool:
         """Check if a frame is allocated."""
-        return frame in self._allocated
+        if not 0 <= frame < self._total_frames:
+            return False
+        if not (self._bitmap[frame >> 6] >> (frame & 63)) & 1:
+            return False
+        # Reserved by a magazine but not handed out
+        return frame not in self._parked
     
     @property
     def free_frames(self) -> int:
-        """Get the number of free frames."""
-        return self._total_frames - len(self._allocated)
+        """
+        Get the number of free frames.
+        
+        Lock-free: the bitmap's free count is a maintained counter, and
+        the parked frames are counted by their dict.
+        """
+        return self._free_count + len(self._parked)
     
     @property
     def used_frames(self) -> int:
         """Get the number of used frames."""
-        return len(self._allocated)
+        return self._total_frames - self.free_frames
     
     def get_stats(self) -> dict[str, int]:
         """Get allocator statistics."""
@@ -10,13 +10,14 @@ Author: YSNRFD
 Version: 1.0.0
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, Any, List
 import struct
 
 from .paging import PageTable, PageFlags
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
 
 
 class RegionType(Enum):
@@ -35,7 +36,7 @@ class MemoryRegion:
     start: int
     end: int
     region_type: RegionType
-    flags: PageFlags
+    flags: int
     name: str = ""
     
     @property
@@ -71,7 +72,8 @@ class AddressSpace:
         self._pid = pid
         self._page_size = page_size
         self._page_table = PageTable(page_size)
-        self._regions: List[MemoryRegion] = []
+        self._regions: List[MemoryRegion] = []   # Sorted by start address
+        self._region_starts: List[int] = []      # Parallel start addresses
         self._heap_end = self.HEAP_START
         self._stack_end = self.STACK_START
         self._logger = get_logger('address_space')
@@ -94,7 +96,7 @@ class AddressSpace:
         start: int,
         size: int,
         region_type: RegionType,
-        flags: PageFlags,
+        flags: int,
         name: str = ""
     ) -> MemoryRegion:
         """
@@ -112,10 +114,13 @@ class AddressSpace:
         """
         end = start + size
         
-        # Check for overlaps
-        for region in self._regions:
-            if region.overlaps(MemoryRegion(start, end, region_type, flags)):
-                raise ValueError(f"Region overlaps with existing region")
+        # Regions never overlap, so only the neighbours at the insertion
+        # point can overlap the new one
+        index = bisect_right(self._region_starts, start)
+        if index > 0 and self._regions[index - 1].end > start:
+            raise ValueError(f"Region overlaps with existing region")
+        if index < len(self._regions) and self._regions[index].start < end:
+            raise ValueError(f"Region overlaps with existing region")
         
         region = MemoryRegion(
             start=start,
@@ -125,37 +130,43 @@ class AddressSpace:
             name=name
         )
         
-        self._regions.append(region)
-        self._regions.sort(key=lambda r: r.start)
+        self._regions.insert(index, region)
+        self._region_starts.insert(index, start)
         
-        self._logger.debug(
-            f"Added memory region",
-            context={
-                'pid': self._pid,
-                'start': hex(start),
-                'size': size,
-                'type': region_type.name
-            }
-        )
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Added memory region",
+                context={
+                    'pid': self._pid,
+                    'start': hex(start),
+                    'size': size,
+                    'type': region_type.name
+                }
+            )
         
         return region
     
     def remove_region(self, start: int) -> Optional[MemoryRegion]:
         """Remove a memory region by its start address."""
-        for i, region in enumerate(self._regions):
-            if region.start == start:
-                removed = self._regions.pop(i)
-                self._logger.debug(
-                    f"Removed memory region",
-                    context={'pid': self._pid, 'start': hex(start)}
-                )
-                return removed
-        return None
+        index = bisect_left(self._region_starts, start)
+        if index == len(self._region_starts) or self._region_starts[index] != start:
+            return None
+        
+        del self._region_starts[index]
+        removed = self._regions.pop(index)
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Removed memory region",
+                context={'pid': self._pid, 'start': hex(start)}
+            )
+        return removed
     
     def find_region(self, address: int) -> Optional[MemoryRegion]:
         """Find the region containing an address."""
-        for region in self._regions:
-            if region.contains(address):
+        index = bisect_right(self._region_starts, address) - 1
+        if index >= 0:
+            region = self._regions[index]
+            if address < region.end:
                 return region
         return None
     
@@ -209,7 +220,7 @@ class AddressSpace:
                 'size': r.size,
                 'type': r.region_type.name,
                 'name': r.name,
-                'flags': str(r.flags)
+                'flags': PageFlags.describe(r.flags)
             }
             for r in self._regions
         ]
@@ -217,6 +228,7 @@ class AddressSpace:
     def clear(self) -> None:
         """Clear all regions and page table."""
         self._regions.clear()
+        self._region_starts.clear()
         self._page_table.clear()
         self._heap_end = self.HEAP_START
         self._stack_end = self.STACK_START
@@ -52,6 +52,10 @@ class ContextSwitcher:
     def __init__(self):
         self._stats = ContextSwitchStats()
         self._current_process: Optional[ProcessControlBlock] = None
+        
+        # PID of the running process, kept alongside _current_process so
+        # callers that only need the PID read a plain attribute
+        self.current_pid: Optional[int] = None
         self._logger = get_logger('context_switch')
         
         # Simulated overhead for context switch (microseconds)
@@ -114,6 +118,7 @@ class ContextSwitcher:
             self._stats.process_to_process += 1
         
         self._current_process = to_process
+        self.current_pid = to_process.pid if to_process else None
     
     def _save_context(self, pcb: ProcessControlBlock) -> None:
         """
@@ -163,7 +168,8 @@ class ContextSwitcher:
             registers=parent.context.registers.copy()
         )
         
-        # Copy resources (files, etc.)
+        # Copy resources (files, etc.). The environment and signal
+        # handlers are copy-on-write, so these copies are O(1).
         child.cwd = parent.cwd
         child.environ = parent.environ.copy()
         
@@ -201,11 +207,10 @@ class ContextSwitcher:
     
     def get_current_pid(self) -> Optional[int]:
         """Get the PID of the currently running process."""
-        if self._current_process:
-            return self._current_process.pid
-        return None
+        return self.current_pid
     
     def reset(self) -> None:
         """Reset the context switcher state."""
         self._stats = ContextSwitchStats()
         self._current_process = None
+        self.current_pid = None
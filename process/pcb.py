@@ -15,14 +15,74 @@ Version: 1.0.0
 
 import time
 from dataclasses import dataclass, field
-from typing import Any, Optional, Callable, List
+from typing import Any, Optional, Callable, Iterator, List
 from collections import deque
+from collections.abc import MutableMapping
 
 from .states import ProcessState, ProcessFlag, Signal
 from pyos.logger import Logger, get_logger
 
 
-@dataclass
+class CopyOnWriteDict(MutableMapping):
+    """
+    A dict whose copies share storage until one of them is written.
+    
+    fork() copies the parent's environment and signal handlers, but most
+    children exec straight away and never touch them. copy() is O(1):
+    both mappings keep reading the same dict, and whichever side writes
+    first takes a private copy.
+    """
+    
+    __slots__ = ('_data', '_shared')
+    
+    def __init__(self, data: Optional[dict] = None):
+        self._data = {} if data is None else dict(data)
+        self._shared = False
+    
+    def copy(self) -> 'CopyOnWriteDict':
+        """Return a copy sharing this mapping's storage."""
+        clone = CopyOnWriteDict.__new__(CopyOnWriteDict)
+        clone._data = self._data
+        clone._shared = self._shared = True
+        return clone
+    
+    def _own(self) -> dict:
+        """Take a private copy of the storage if it is shared."""
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+        return self._data
+    
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._data.get(key, default)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+    
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._own()[key] = value
+    
+    def __delitem__(self, key: Any) -> None:
+        del self._own()[key]
+    
+    def clear(self) -> None:
+        self._data = {}
+        self._shared = False
+    
+    def __repr__(self) -> str:
+        return f"CopyOnWriteDict({self._data!r})"
+
+
+@dataclass(slots=True)
 class CpuContext:
     """
     Simulated CPU context for a process.
@@ -37,7 +97,7 @@ class CpuContext:
     registers: dict[int, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessResources:
     """Resource usage and limits for a process."""
     # File descriptors
@@ -57,7 +117,7 @@ class ProcessResources:
     message_queues: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessStats:
     """Statistics for a process."""
     # Timing
@@ -99,6 +159,20 @@ class ProcessControlBlock:
         >>> pcb.state = ProcessState.READY
     """
     
+    # No per-instance __dict__: the kernel keeps a PCB for every process
+    # and pools freed ones, so each saved byte is multiplied many times
+    __slots__ = (
+        'pid', 'parent_pid', 'name', 'uid', 'gid', 'command',
+        'state', 'exit_code',
+        'priority', 'nice', 'time_slice', 'time_remaining',
+        'sched_queue', 'sched_wait_start',
+        'context', 'children', 'threads', 'resources', 'stats', 'flags',
+        'pending_signals', 'signal_handlers', 'signal_mask',
+        'cwd', 'environ',
+        '_entry_point', '_entry_args', '_entry_kwargs',
+        '_logger',
+    )
+    
     _pid_counter = 0
     _pid_lock = None  # Will be set to threading.Lock on first use
     
@@ -129,6 +203,8 @@ class ProcessControlBlock:
         self.nice = 0
         self.time_slice = 100  # milliseconds
         self.time_remaining = self.time_slice
+        self.sched_queue = -1  # Scheduler queue index, or -1
+        self.sched_wait_start = -1  # monotonic_ns aging wait start, or -1
         
         # CPU Context
         self.context = CpuContext()
@@ -148,14 +224,14 @@ class ProcessControlBlock:
         
         # Signal handling
         self.pending_signals: deque[Signal] = deque()
-        self.signal_handlers: dict[Signal, Callable] = {}
+        self.signal_handlers: CopyOnWriteDict = CopyOnWriteDict()
         self.signal_mask: set[Signal] = set()
         
         # Working directory
         self.cwd = "/"
         
         # Environment
-        self.environ: dict[str, str] = {}
+        self.environ: CopyOnWriteDict = CopyOnWriteDict()
         
         # User callback for execution (simulated)
         self._entry_point: Optional[Callable] = None
@@ -18,9 +18,17 @@ from collections import defaultdict
 from typing import Optional, Callable, Any, List
 
 from .pcb import ProcessControlBlock
-from .states import ProcessState, ProcessFlag, Signal
+from .states import (
+    ProcessState,
+    ProcessFlag,
+    Signal,
+    SIGNAL_DISPOSITION,
+    DISP_TERMINATE,
+    DISP_STOP,
+)
 from .scheduler import SchedulerAlgorithm, create_scheduler
 from .context_switch import ContextSwitcher
+from .pid_pool import PidPool
 from pyos.core.registry import Subsystem, SubsystemState
 from pyos.core.config_loader import get_config
 from pyos.exceptions import (
@@ -32,7 +40,7 @@ from pyos.exceptions import (
     ResourceLimitExceeded,
     ZombieProcessError,
 )
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
 
 
 class ProcessManager(Subsystem):
@@ -55,12 +63,39 @@ class ProcessManager(Subsystem):
     def __init__(self):
         super().__init__('process_manager')
         self._processes: dict[int, ProcessControlBlock] = {}
-        self._pid_tree: dict[int, list[int]] = defaultdict(list)
+        self._pid_tree: dict[int, set[int]] = defaultdict(set)
         self._scheduler: Optional[SchedulerAlgorithm] = None
         self._context_switcher: Optional[ContextSwitcher] = None
-        self._next_pid = 2  # Start at 2 (1 is init)
-        self._pid_lock = threading.Lock()
-        self._zombie_list: List[int] = []
+        # Guards the process table (PIDs have their own lock in the pool).
+        # Readers don't take it: single lookups are atomic dict operations,
+        # and whole-table readers use the published snapshot below.
+        self._table_lock = threading.Lock()
+        
+        # Immutable snapshot of the process table for lock-free iteration.
+        # Writers invalidate it under the lock; the next reader rebuilds it.
+        self._process_snapshot: Optional[tuple[ProcessControlBlock, ...]] = None
+        self._max_processes = 0
+        self._active_count = 0  # Processes in the table that aren't zombies
+        
+        # PID allocation, under the pool's own lock
+        self._pid_pool: Optional[PidPool] = None
+        
+        # Time slice tracking: schedule() counts timer ticks and expires
+        # the running process once the count reaches its deadline
+        self._timer_ticks = 0
+        self._slice_owner: Optional[ProcessControlBlock] = None
+        self._slice_deadline = 0
+        
+        # Default action for processes without a handler, indexed by
+        # signal number. Signals with no action (SIGNAL_IGNORE) are dropped.
+        actions = {
+            DISP_TERMINATE: self._signal_terminate,
+            DISP_STOP: self._signal_stop,
+        }
+        self._default_signal_action: tuple[
+            Optional[Callable[[ProcessControlBlock, Signal], None]], ...
+        ] = tuple(actions.get(disp) for disp in SIGNAL_DISPOSITION)
+        self._zombie_set: set[int] = set()
     
     def initialize(self) -> None:
         """Initialize the process manager."""
@@ -68,6 +103,9 @@ class ProcessManager(Subsystem):
         
         config = get_config()
         
+        self._max_processes = config.process.max_processes
+        self._pid_pool = PidPool(config.process.max_pid)
+        
         # Create scheduler based on config
         algorithm = config.scheduler.algorithm
         kwargs = {'quantum': config.scheduler.quantum}
@@ -101,7 +139,10 @@ class ProcessManager(Subsystem):
         init.state = ProcessState.RUNNING
         
         self._processes[1] = init
-        self._pid_tree[0].append(1)
+        self._process_snapshot = None
+        self._pid_tree[0].add(1)
+        self._pid_pool.reserve(1)
+        self._active_count += 1
         
         self._logger.debug("Created init process", pid=1)
     
@@ -114,58 +155,75 @@ class ProcessManager(Subsystem):
         """Stop the process manager."""
         self._logger.info("Stopping process manager")
         
-        # Terminate all processes
-        for pid in list(self._processes.keys()):
-            if pid != 1:  # Don't terminate init yet
-                try:
-                    self.terminate_process(pid)
-                except Exception as e:
-                    self._logger.error(f"Error terminating process {pid}: {e}")
+        # Terminate all processes. Terminating a parent also takes out its
+        # subtree, so skip PIDs that are already gone or zombies rather
+        # than let terminate_process raise for them.
+        processes = self._processes
+        for pid in list(processes):
+            if pid == 1:  # Don't terminate init yet
+                continue
+            pcb = processes.get(pid)
+            if pcb is None or pcb.state == ProcessState.ZOMBIE:
+                continue
+            try:
+                self.terminate_process(pid)
+            except Exception as e:
+                self._logger.error(f"Error terminating process {pid}: {e}")
         
         self.set_state(SubsystemState.STOPPED)
     
     def cleanup(self) -> None:
         """Clean up process manager resources."""
         self._processes.clear()
+        self._process_snapshot = None
         self._pid_tree.clear()
-        self._zombie_list.clear()
+        self._zombie_set.clear()
+        self._active_count = 0
+    
+    def refresh_config(self) -> None:
+        """
+        Re-read runtime-tunable limits from the configuration.
+        
+        max_pid sizes the PID bitmap and only takes effect on initialize.
+        """
+        config = get_config()
+        self._max_processes = config.process.max_processes
     
     @property
     def process_count(self) -> int:
         """Get the number of active processes."""
-        return len([p for p in self._processes.values()
-                   if p.state != ProcessState.ZOMBIE])
+        return self._active_count
     
     @property
     def current_pid(self) -> Optional[int]:
         """Get the currently running process PID."""
-        if self._context_switcher:
-            return self._context_switcher.get_current_pid()
-        return None
+        context_switcher = self._context_switcher
+        return context_switcher.current_pid if context_switcher else None
     
     def _generate_pid(self) -> int:
         """Generate a new unique PID."""
-        config = get_config()
-        max_pid = config.process.max_pid
+        pid = self._pid_pool.allocate()
+        if pid is None:
+            raise ProcessCreationError("No available PIDs")
+        return pid
+    
+    def _generate_pids(self, count: int) -> List[int]:
+        """
+        Generate several unique PIDs at once.
         
-        with self._pid_lock:
-            pid = self._next_pid
-            attempts = 0
-            
-            while pid in self._processes and attempts < max_pid:
-                pid = (pid % max_pid) + 1
-                if pid == 1:
-                    pid = 2  # Skip PID 1
-                attempts += 1
-            
-            if attempts >= max_pid:
-                raise ProcessCreationError("No available PIDs")
-            
-            self._next_pid = (pid % max_pid) + 1
-            if self._next_pid == 1:
-                self._next_pid = 2
-            
-            return pid
+        Args:
+            count: Number of PIDs needed
+        
+        Returns:
+            List of PIDs
+        
+        Raises:
+            ProcessCreationError: If fewer than count PIDs are available
+        """
+        pids = self._pid_pool.allocate_many(count)
+        if pids is None:
+            raise ProcessCreationError("No available PIDs")
+        return pids
     
     def create_process(
         self,
@@ -199,10 +257,8 @@ class ProcessManager(Subsystem):
         Raises:
             ProcessCreationError: If process cannot be created
         """
-        config = get_config()
-        
         # Check process limit
-        if self.process_count >= config.process.max_processes:
+        if self.process_count >= self._max_processes:
             raise ProcessCreationError("Maximum process count reached")
         
         # Determine parent
@@ -217,6 +273,120 @@ class ProcessManager(Subsystem):
         pid = self._generate_pid()
         
         # Create PCB
+        pcb = self._build_pcb(
+            pid, parent_pid, name, uid, gid, priority,
+            command, entry_point, entry_args, daemon
+        )
+        
+        # Add to process table
+        with self._table_lock:
+            self._processes[pid] = pcb
+            self._process_snapshot = None
+            self._pid_tree[parent_pid].add(pid)
+            self._active_count += 1
+        
+        # Update parent's children list
+        parent = self._processes.get(parent_pid)
+        if parent:
+            parent.add_child(pid)
+        
+        # Hand to the scheduler, which queues it with any other new
+        # processes in one batch on its next dispatch
+        pcb.state = ProcessState.READY
+        self._scheduler.submit_process(pcb)
+        
+        if self._logger.is_enabled_for(LogLevel.INFO):
+            self._logger.info(
+                f"Created process '{name}'",
+                pid=pid,
+                context={'ppid': parent_pid, 'priority': priority}
+            )
+        
+        return pid
+    
+    def create_processes(self, specs: List[dict[str, Any]]) -> List[int]:
+        """
+        Create several processes at once.
+        
+        Each spec holds the keyword arguments of create_process. PIDs are
+        allocated and the process table is updated under a single lock
+        acquisition each, and the scheduler receives the whole batch.
+        
+        Args:
+            specs: One dict of create_process arguments per process
+        
+        Returns:
+            PIDs of the new processes, in spec order
+        
+        Raises:
+            ProcessCreationError: If the batch cannot be created
+        """
+        count = len(specs)
+        if not count:
+            return []
+        
+        # Check process limit for the whole batch up front
+        if self.process_count + count > self._max_processes:
+            raise ProcessCreationError("Maximum process count reached")
+        
+        pids = self._generate_pids(count)
+        
+        # Build PCBs outside the lock
+        processes = self._processes
+        default_parent = self.current_pid or 1
+        pcbs = []
+        for pid, spec in zip(pids, specs):
+            spec = dict(spec)
+            parent_pid = spec.pop('parent_pid', None)
+            if parent_pid is None:
+                parent_pid = default_parent
+            if parent_pid not in processes:
+                parent_pid = 1  # Default to init
+            pcbs.append(self._build_pcb(pid, parent_pid, **spec))
+        
+        # Add to process table
+        with self._table_lock:
+            pid_tree = self._pid_tree
+            for pcb in pcbs:
+                processes[pcb.pid] = pcb
+                pid_tree[pcb.parent_pid].add(pcb.pid)
+            self._process_snapshot = None
+            self._active_count += count
+        
+        # Update parents' children lists
+        for pcb in pcbs:
+            parent = processes.get(pcb.parent_pid)
+            if parent:
+                parent.add_child(pcb.pid)
+            pcb.state = ProcessState.READY
+        
+        # Add to scheduler
+        self._scheduler.add_processes(pcbs)
+        
+        if self._logger.is_enabled_for(LogLevel.INFO):
+            self._logger.info(
+                f"Created {count} processes",
+                context={'first_pid': pids[0], 'last_pid': pids[-1]}
+            )
+        
+        return pids
+    
+    def _build_pcb(
+        self,
+        pid: int,
+        parent_pid: int,
+        name: str,
+        uid: int = 0,
+        gid: int = 0,
+        priority: int = 20,
+        command: Optional[str] = None,
+        entry_point: Optional[Callable] = None,
+        entry_args: tuple = (),
+        daemon: bool = False
+    ) -> ProcessControlBlock:
+        """Construct a PCB for a new process."""
+        # Always a fresh PCB: callers of get_process() may still hold the
+        # PCB of a removed process, so one must never be reused
         pcb = ProcessControlBlock(
             pid=pid,
             parent_pid=parent_pid,
@@ -235,26 +405,7 @@ class ProcessManager(Subsystem):
         if daemon:
             pcb.set_daemon(True)
         
-        # Add to process table
-        self._processes[pid] = pcb
-        self._pid_tree[parent_pid].append(pid)
-        
-        # Update parent's children list
-        parent = self._processes.get(parent_pid)
-        if parent:
-            parent.add_child(pid)
-        
-        # Add to scheduler
-        pcb.state = ProcessState.READY
-        self._scheduler.add_process(pcb)
-        
-        self._logger.info(
-            f"Created process '{name}'",
-            pid=pid,
-            context={'ppid': parent_pid, 'priority': priority}
-        )
-        
-        return pid
+        return pcb
     
     def terminate_process(
         self,
@@ -281,61 +432,102 @@ class ProcessManager(Subsystem):
         if pcb.state == ProcessState.ZOMBIE:
             return  # Already terminated
         
-        self._logger.info(
-            f"Terminating process '{pcb.name}'",
-            pid=pid,
-            context={'exit_code': exit_code}
-        )
-        
-        # Terminate children first
-        for child_pid in pcb.children[:]:
+        # Collect the live subtree in pre-order; walking it backwards
+        # terminates every child before its parent, without recursing.
+        # Nothing is unlinked until the collection pass is over, so the
+        # children lists can be iterated in place rather than copied.
+        processes = self._processes
+        order = []
+        stack = [pcb]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for child_pid in node.children:
+                child = processes.get(child_pid)
+                if child and child.state != ProcessState.ZOMBIE:
+                    stack.append(child)
+        
+        remove_from_scheduler = self._scheduler.remove_process
+        log_info = self._logger.is_enabled_for(LogLevel.INFO)
+        for node in reversed(order):
+            node_pid = node.pid
+            node_exit_code = exit_code if node is pcb else 1
+            
+            if log_info:
+                self._logger.info(
+                    f"Terminating process '{node.name}'",
+                    pid=node_pid,
+                    context={'exit_code': node_exit_code}
+                )
+            
             try:
-                self.terminate_process(child_pid, exit_code=1)
+                # Remove from scheduler
+                remove_from_scheduler(node)
+                
+                # Update state
+                node.state = ProcessState.TERMINATED
+                node.exit_code = node_exit_code
+                
+                # Update parent
+                parent = processes.get(node.parent_pid)
+                if parent:
+                    parent.remove_child(node_pid)
+                
+                # Convert to zombie if parent hasn't reaped
+                if parent and parent.state != ProcessState.ZOMBIE:
+                    node.state = ProcessState.ZOMBIE
+                    self._zombie_set.add(node_pid)
+                    self._active_count -= 1
+                    
+                    # Send SIGCHLD to parent
+                    parent.send_signal(Signal.SIGCHLD)
+                else:
+                    # No parent, can fully remove; already unlinked above
+                    self._remove_process(node_pid, unlink_parent=False)
             except Exception:
-                pass
-        
-        # Remove from scheduler
-        self._scheduler.remove_process(pcb)
-        
-        # Update state
-        pcb.state = ProcessState.TERMINATED
-        pcb.exit_code = exit_code
-        
-        # Update parent
-        parent = self._processes.get(pcb.parent_pid)
-        if parent:
-            parent.remove_child(pid)
-        
-        # Convert to zombie if parent hasn't reaped
-        if parent and parent.state != ProcessState.ZOMBIE:
-            pcb.state = ProcessState.ZOMBIE
-            self._zombie_list.append(pid)
-            
-            # Send SIGCHLD to parent
-            parent.send_signal(Signal.SIGCHLD)
-        else:
-            # No parent, can fully remove
-            self._remove_process(pid)
+                # A failing descendant must not stop the rest of the
+                # teardown; failures on the target itself propagate
+                if node is pcb:
+                    raise
     
-    def _remove_process(self, pid: int) -> None:
-        """Fully remove a process from the system."""
+    def _remove_process(self, pid: int, *, unlink_parent: bool = True) -> None:
+        """
+        Fully remove a process from the system.
+        
+        Args:
+            pid: Process ID
+            unlink_parent: Remove the PID from the parent's children list.
+                The termination path has already done so and passes False.
+        """
         pcb = self._processes.get(pid)
         if pcb:
             # Remove from parent's children
-            parent = self._processes.get(pcb.parent_pid)
-            if parent:
-                parent.remove_child(pid)
+            if unlink_parent:
+                parent = self._processes.get(pcb.parent_pid)
+                if parent:
+                    parent.remove_child(pid)
             
             # Remove from pid tree
-            if pid in self._pid_tree[pcb.parent_pid]:
-                self._pid_tree[pcb.parent_pid].remove(pid)
+            siblings = self._pid_tree.get(pcb.parent_pid)
+            if siblings is not None:
+                siblings.discard(pid)
+                if not siblings:
+                    del self._pid_tree[pcb.parent_pid]
+            
+            # Remove from process table; zombies were already uncounted
+            with self._table_lock:
+                del self._processes[pid]
+                self._process_snapshot = None
+                if pcb.state != ProcessState.ZOMBIE:
+                    self._active_count -= 1
+            self._pid_pool.free(pid)
             
-            # Remove from process table
-            del self._processes[pid]
+            # Remove from zombie set if present
+            self._zombie_set.discard(pid)
             
-            # Remove from zombie list if present
-            if pid in self._zombie_list:
-                self._zombie_list.remove(pid)
+            # Stop tracking the time slice of a removed process
+            if self._slice_owner is pcb:
+                self._slice_owner = None
     
     def fork(self, parent_pid: Optional[int] = None) -> int:
         """
@@ -374,19 +566,15 @@ class ProcessManager(Subsystem):
             
             child = self._processes[child_pid]
             
-            # Copy context
+            # Copy context, cwd, environment and signal handlers
             self._context_switcher.fork_context(parent, child)
             
-            # Copy resources
-            child.cwd = parent.cwd
-            child.environ = parent.environ.copy()
-            child.signal_handlers = parent.signal_handlers.copy()
-            
-            self._logger.debug(
-                f"Forked process",
-                pid=parent_pid,
-                context={'child_pid': child_pid}
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Forked process",
+                    pid=parent_pid,
+                    context={'child_pid': child_pid}
+                )
             
             return child_pid
             
@@ -423,11 +611,12 @@ class ProcessManager(Subsystem):
             pcb.resources.memory_allocated = 0
             pcb.stats = type(pcb.stats)()
             
-            self._logger.debug(
-                f"Exec'd process",
-                pid=pid,
-                context={'new_name': name}
-            )
+            if self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(
+                    f"Exec'd process",
+                    pid=pid,
+                    context={'new_name': name}
+                )
             
         except Exception as e:
             raise ExecError(f"Exec failed: {e}", pid=pid, path=name)
@@ -452,11 +641,22 @@ class ProcessManager(Subsystem):
     
     def list_processes(self) -> List[dict[str, Any]]:
         """List all processes as dictionaries."""
-        return [pcb.to_dict() for pcb in self._processes.values()]
+        return [pcb.to_dict() for pcb in self._get_snapshot()]
+    
+    def _get_snapshot(self) -> tuple[ProcessControlBlock, ...]:
+        """Get the published process table snapshot, rebuilding if stale."""
+        snapshot = self._process_snapshot
+        if snapshot is None:
+            with self._table_lock:
+                snapshot = self._process_snapshot
+                if snapshot is None:
+                    snapshot = tuple(self._processes.values())
+                    self._process_snapshot = snapshot
+        return snapshot
     
     def get_children(self, pid: int) -> List[int]:
         """Get the PIDs of a process's children."""
-        return self._pid_tree.get(pid, [])
+        return list(self._pid_tree.get(pid, ()))
     
     def send_signal(self, pid: int, signal: Signal) -> None:
         """
@@ -472,11 +672,12 @@ class ProcessManager(Subsystem):
         pcb = self.get_process(pid)
         pcb.send_signal(signal)
         
-        self._logger.debug(
-            f"Sent signal to process",
-            pid=pid,
-            context={'signal': signal.name}
-        )
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Sent signal to process",
+                pid=pid,
+                context={'signal': signal.name}
+            )
     
     def kill(self, pid: int, signal: Signal = Signal.SIGTERM) -> None:
         """
@@ -509,15 +710,23 @@ class ProcessManager(Subsystem):
             List of reaped PIDs
         """
         reaped = []
-        
-        for pid in self._zombie_list[:]:
-            pcb = self._processes.get(pid)
-            if pcb and pcb.parent_pid:
-                parent = self._processes.get(pcb.parent_pid)
-                # Reap if parent is init or has already waited
-                if pcb.parent_pid == 1 or parent is None:
-                    self._remove_process(pid)
-                    reaped.append(pid)
+        processes = self._processes
+        
+        # Reaping a zombie orphans its own zombie children, which makes
+        # them reapable too, so keep going until a pass finds nothing
+        while True:
+            reaped_this_pass = []
+            for pid in list(self._zombie_set):
+                pcb = processes.get(pid)
+                if pcb and pcb.parent_pid:
+                    # Reap if parent is init or has already waited
+                    if pcb.parent_pid == 1 or pcb.parent_pid not in processes:
+                        self._remove_process(pid)
+                        reaped_this_pass.append(pid)
+            
+            if not reaped_this_pass:
+                break
+            reaped.extend(reaped_this_pass)
         
         return reaped
     
@@ -527,35 +736,42 @@ class ProcessManager(Subsystem):
         
         This is called by the timer interrupt handler.
         """
+        self._timer_ticks += 1
         current = self._context_switcher.current_process
-        
-        if current:
-            # Check for time slice expiry
-            current.time_remaining -= 1
-            
-            if current.time_remaining <= 0:
-                # Time slice expired
-                current.update_cpu_time(0.001)  # Simulated
-                self._scheduler.time_slice_expired(current)
-                
-                # Get next process
-                next_pcb = self._scheduler.get_next_process()
-                if next_pcb and next_pcb != current:
-                    self._context_switcher.switch(current, next_pcb)
+        if current is None:
+            return
+        
+        # Arm the deadline on the first tick a process is seen running,
+        # then compare against it instead of counting its slice down
+        if current is not self._slice_owner:
+            self._slice_owner = current
+            self._slice_deadline = self._timer_ticks + current.time_remaining - 1
+        if self._timer_ticks < self._slice_deadline:
+            return
+        
+        # Time slice expired
+        self._slice_owner = None
+        current.time_remaining = 0
+        current.update_cpu_time(0.001)  # Simulated
+        self._scheduler.reschedule(current, yielded=False)
+        
+        # Get next process
+        next_pcb = self._scheduler.get_next_process()
+        if next_pcb and next_pcb != current:
+            self._context_switcher.switch(current, next_pcb)
     
     def tick(self) -> None:
         """
         Called periodically by the kernel timer.
         """
-        # Process signals for current process
+        # Process signals for current process. Most ticks have none, so
+        # test the queue before paying for get_next_signal()
         current = self._context_switcher.current_process
-        if current:
-            signal = current.get_next_signal()
-            if signal:
-                self._handle_signal(current, signal)
+        if current is not None and current.pending_signals:
+            self._handle_signal(current, current.get_next_signal())
         
         # Reap zombies
-        if self._zombie_list:
+        if self._zombie_set:
             self.reap_zombies()
     
     def _handle_signal(
@@ -564,8 +780,6 @@ class ProcessManager(Subsystem):
         signal: Signal
     ) -> None:
         """Handle a signal for a process."""
-        from .states import SIGNAL_TERMINATE, SIGNAL_IGNORE, SIGNAL_STOP
-        
         handler = pcb.signal_handlers.get(signal)
         
         if handler:
@@ -578,19 +792,31 @@ class ProcessManager(Subsystem):
                     pid=pcb.pid,
                     context={'signal': signal.name, 'error': str(e)}
                 )
-        elif signal in SIGNAL_TERMINATE:
-            self.terminate_process(pcb.pid, exit_code=128 + signal.value)
-        elif signal in SIGNAL_STOP:
-            pcb.state = ProcessState.STOPPED
-            self._scheduler.remove_process(pcb)
-        # SIGNAL_IGNORE signals are simply dropped
+        else:
+            action = self._default_signal_action[signal]
+            if action:
+                action(pcb, signal)
+    
+    def _signal_terminate(self, pcb: ProcessControlBlock, signal: Signal) -> None:
+        """Default action for terminating signals."""
+        self.terminate_process(pcb.pid, exit_code=128 + signal.value)
+    
+    def _signal_stop(self, pcb: ProcessControlBlock, signal: Signal) -> None:
+        """Default action for stopping signals."""
+        pcb.state = ProcessState.STOPPED
+        self._scheduler.remove_process(pcb)
     
     def get_stats(self) -> dict[str, Any]:
         """Get process manager statistics."""
+        with self._table_lock:
+            total = len(self._processes)
+            active = self._active_count
+            zombies = len(self._zombie_set)
+        
         return {
-            'total_processes': len(self._processes),
-            'active_processes': self.process_count,
-            'zombie_processes': len(self._zombie_list),
+            'total_processes': total,
+            'active_processes': active,
+            'zombie_processes': zombies,
             'scheduler_queue_size': self._scheduler.count(),
             'context_switches': self._context_switcher.stats.total_switches,
             'current_pid': self.current_pid
@@ -7,14 +7,17 @@ Author: YSNRFD
 Version: 1.0.0
 """
 
-from enum import Enum, auto
+from enum import IntEnum
 from typing import Optional
 
 
-class ProcessState(Enum):
+class ProcessState(IntEnum):
     """
     Process lifecycle states.
     
+    An IntEnum, so state checks on the scheduling hot path are plain
+    integer comparisons.
+    
     State transitions:
         NEW -> READY: Process created and ready to run
         READY -> RUNNING: Scheduler selects process
@@ -26,40 +29,40 @@ class ProcessState(Enum):
         ZOMBIE -> (removed): Parent reaps the process
     """
     
-    NEW = auto()
+    NEW = 1
     """Process is being created."""
     
-    READY = auto()
+    READY = 2
     """Process is ready to run but waiting for CPU."""
     
-    RUNNING = auto()
+    RUNNING = 3
     """Process is currently executing."""
     
-    WAITING = auto()
+    WAITING = 4
     """Process is blocked waiting for an event."""
     
-    TERMINATED = auto()
+    TERMINATED = 5
     """Process has finished execution."""
     
-    ZOMBIE = auto()
+    ZOMBIE = 6
     """Process has terminated but not yet reaped by parent."""
     
-    STOPPED = auto()
+    STOPPED = 7
     """Process is stopped (e.g., by a signal)."""
 
 
-class ProcessFlag(Enum):
+class ProcessFlag(IntEnum):
     """Process flags and attributes."""
-    RUNNING = auto()       # Normal process
-    DAEMON = auto()        # Daemon process
-    SESSION_LEADER = auto() # Session leader
-    GROUP_LEADER = auto()  # Process group leader
-    TRACED = auto()        # Being traced by ptrace
-    KTHREAD = auto()       # Kernel thread
+    RUNNING = 1         # Normal process
+    DAEMON = 2          # Daemon process
+    SESSION_LEADER = 3  # Session leader
+    GROUP_LEADER = 4    # Process group leader
+    TRACED = 5          # Being traced by ptrace
+    KTHREAD = 6         # Kernel thread
 
 
-class Signal(Enum):
-    """Standard UNIX signals."""
+class Signal(IntEnum):
+    """Standard UNIX signals. Members compare equal to their numbers."""
     SIGHUP = 1      # Hangup
     SIGINT = 2      # Interrupt
     SIGQUIT = 3     # Quit
@@ -85,9 +88,26 @@ class Signal(Enum):
 
 
 # Default signal dispositions
-SIGNAL_TERMINATE = {Signal.SIGHUP, Signal.SIGINT, Signal.SIGKILL, 
-                    Signal.SIGTERM, Signal.SIGUSR1, Signal.SIGUSR2}
-SIGNAL_IGNORE = {Signal.SIGCHLD, Signal.SIGCONT}
-SIGNAL_STOP = {Signal.SIGSTOP, Signal.SIGTSTP, Signal.SIGTTIN, Signal.SIGTTOU}
-SIGNAL_CORE = {Signal.SIGQUIT, Signal.SIGILL, Signal.SIGABRT, 
-               Signal.SIGBUS, Signal.SIGFPE, Signal.SIGSEGV, Signal.SIGTRAP}
+SIGNAL_TERMINATE = frozenset({Signal.SIGHUP, Signal.SIGINT, Signal.SIGKILL,
+                              Signal.SIGTERM, Signal.SIGUSR1, Signal.SIGUSR2})
+SIGNAL_IGNORE = frozenset({Signal.SIGCHLD, Signal.SIGCONT})
+SIGNAL_STOP = frozenset({Signal.SIGSTOP, Signal.SIGTSTP, Signal.SIGTTIN,
+                         Signal.SIGTTOU})
+SIGNAL_CORE = frozenset({Signal.SIGQUIT, Signal.SIGILL, Signal.SIGABRT,
+                         Signal.SIGBUS, Signal.SIGFPE, Signal.SIGSEGV,
+                         Signal.SIGTRAP})
+
+# Disposition bits, and the default disposition of each signal indexed by
+# signal number, so dispatch is a tuple index rather than set probes
+DISP_TERMINATE = 1
+DISP_IGNORE = 2
+DISP_STOP = 4
+DISP_CORE = 8
+
+SIGNAL_DISPOSITION: tuple[int, ...] = tuple(
+    (DISP_TERMINATE if number in SIGNAL_TERMINATE else 0)
+    | (DISP_IGNORE if number in SIGNAL_IGNORE else 0)
+    | (DISP_STOP if number in SIGNAL_STOP else 0)
+    | (DISP_CORE if number in SIGNAL_CORE else 0)
+    for number in range(max(Signal) + 1)
+)
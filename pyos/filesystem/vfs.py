@@ -257,6 +257,19 @@ class VirtualFileSystem(Subsystem):
         if parent_ino is None:
             raise FileNotFoundError(f"Parent directory: {parent_path}")
         
+        return self._create_in(parent_ino, parent_path, name, resolved, mode, uid, gid)
+    
+    def _create_in(
+        self,
+        parent_ino: int,
+        parent_path: str,
+        name: str,
+        resolved: str,
+        mode: int,
+        uid: int,
+        gid: int
+    ) -> int:
+        """Create a regular file in an already resolved parent directory."""
         parent = self._inodes[parent_ino]
         
         # Check parent write permission
@@ -283,6 +296,53 @@ class VirtualFileSystem(Subsystem):
         
         return ino
     
+    def touch(
+        self,
+        path: str,
+        mode: int = 0o644,
+        uid: int = 0,
+        gid: int = 0,
+        cwd: str = '/'
+    ) -> int:
+        """
+        Update a file's timestamps, creating it if it does not exist.
+        
+        The parent directory is looked up once and the name checked in
+        it, instead of a stat followed by a create that walks the path
+        again.
+        
+        Args:
+            path: Path of the file
+            mode: Permission mode, if the file is created
+            uid: Owner user ID, if the file is created
+            gid: Owner group ID, if the file is created
+            cwd: Current working directory
+        
+        Returns:
+            Inode number of the file
+        
+        Raises:
+            FileNotFoundError: If the parent directory does not exist
+            PermissionDeniedError: If the file must be created and the
+                parent is not writable
+        """
+        resolved = PathResolver.resolve(path, cwd)
+        parent_path, name = self._get_parent_path(resolved)
+        parent_ino = self._resolve_path(parent_path, '/')
+        
+        if parent_ino is None:
+            raise FileNotFoundError(f"Parent directory: {parent_path}")
+        
+        if resolved == '/':
+            ino = parent_ino
+        else:
+            ino = self._inodes[parent_ino].get_entry(name)
+            if ino is None:
+                return self._create_in(parent_ino, parent_path, name, resolved, mode, uid, gid)
+        
+        self._inodes[ino].touch()
+        return ino
+    
     def mkdir(
         self,
         path: str,
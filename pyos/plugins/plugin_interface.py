@@ -21,7 +21,7 @@ class PluginState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
     """Information about a plugin."""
     name: str
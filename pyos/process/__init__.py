@@ -12,12 +12,15 @@ from .pcb import ProcessControlBlock, PCB, CpuContext, ProcessResources, Process
 from .states import ProcessState, ProcessFlag, Signal
 from .scheduler import (
     SchedulerAlgorithm,
+    ReadyQueue,
     RoundRobinScheduler,
     PriorityScheduler,
     MultiLevelFeedbackQueueScheduler,
-    create_scheduler
+    create_scheduler,
+    register_scheduler,
 )
 from .context_switch import ContextSwitcher, ContextSwitchStats
+from .pid_pool import PidPool
 from .process_manager import ProcessManager
 
 __all__ = [
@@ -33,13 +36,16 @@ __all__ = [
     'Signal',
     # Scheduler
     'SchedulerAlgorithm',
+    'ReadyQueue',
     'RoundRobinScheduler',
     'PriorityScheduler',
     'MultiLevelFeedbackQueueScheduler',
     'create_scheduler',
+    'register_scheduler',
     # Context Switch
     'ContextSwitcher',
     'ContextSwitchStats',
     # Process Manager
+    'PidPool',
     'ProcessManager',
 ]
@@ -0,0 +1,145 @@
+"""
+PID Pool Module
+
+Allocates process IDs for the process manager:
+- O(1) allocation and release from a FIFO free list
+- Bitmap of PIDs in use, guarding against double release
+- Fresh PIDs handed out before freed ones are reused
+
+Author: YSNRFD
+Version: 1.0.0
+"""
+
+import threading
+from collections import deque
+from typing import Optional, List
+
+
+class PidPool:
+    """
+    Pool of process IDs.
+    
+    Never-used PIDs are fed to the free list a window at a time, and
+    released PIDs queue up behind them, so a PID is not reused straight
+    away. The pool has its own lock, so allocating a PID never contends
+    with the process table.
+    
+    Example:
+        >>> pool = PidPool(max_pid=32768)
+        >>> pool.reserve(1)
+        >>> pid = pool.allocate()
+        >>> pool.free(pid)
+    """
+    
+    WINDOW = 256  # Fresh PIDs handed to the free list at a time
+    
+    def __init__(self, max_pid: int, first_pid: int = 2):
+        """
+        Initialize the pool.
+        
+        Args:
+            max_pid: Highest PID the pool hands out
+            first_pid: Lowest PID handed out by allocate
+        """
+        self.max_pid = max_pid
+        self._bitmap = bytearray((max_pid >> 3) + 1)
+        self._free: deque[int] = deque()
+        self._window = first_pid  # Next never-used PID
+        self._lock = threading.Lock()
+    
+    def _grow(self) -> bool:
+        """
+        Feed the next window of never-used PIDs to the free list.
+        
+        Must be called with the lock held.
+        
+        Returns:
+            True if any PIDs were added
+        """
+        start = self._window
+        end = min(start + self.WINDOW, self.max_pid + 1)
+        if start >= end:
+            return False
+        
+        self._free.extend(range(start, end))
+        self._window = end
+        return True
+    
+    def allocate(self) -> Optional[int]:
+        """
+        Allocate a PID.
+        
+        Returns:
+            PID, or None if the pool is exhausted
+        """
+        with self._lock:
+            free = self._free
+            if not free and not self._grow():
+                return None
+            
+            pid = free.popleft()
+            self._bitmap[pid >> 3] |= 1 << (pid & 7)
+            return pid
+    
+    def allocate_many(self, count: int) -> Optional[List[int]]:
+        """
+        Allocate several PIDs in one locked pass.
+        
+        Allocation is all-or-nothing.
+        
+        Args:
+            count: Number of PIDs to allocate
+        
+        Returns:
+            List of PIDs, or None if not enough are available
+        """
+        if count <= 0:
+            return []
+        
+        with self._lock:
+            free = self._free
+            while len(free) < count:
+                if not self._grow():
+                    return None
+            
+            bitmap = self._bitmap
+            pids = [free.popleft() for _ in range(count)]
+            for pid in pids:
+                bitmap[pid >> 3] |= 1 << (pid & 7)
+            return pids
+    
+    def reserve(self, pid: int) -> None:
+        """
+        Mark a PID outside the allocation range (such as init) as in use.
+        
+        Args:
+            pid: PID to reserve
+        """
+        with self._lock:
+            self._bitmap[pid >> 3] |= 1 << (pid & 7)
+    
+    def free(self, pid: int) -> bool:
+        """
+        Return a PID to the pool.
+        
+        Args:
+            pid: PID to release
+        
+        Returns:
+            True if released, False if it was not in use
+        """
+        index = pid >> 3
+        bit = 1 << (pid & 7)
+        with self._lock:
+            # The bitmap guards against handing the same PID out twice
+            if not self._bitmap[index] & bit:
+                return False
+            self._bitmap[index] &= ~bit
+            self._free.append(pid)
+            return True
+    
+    def is_allocated(self, pid: int) -> bool:
+        """Check whether a PID is in use."""
+        if not 0 <= pid <= self.max_pid:
+            return False
+        return bool(self._bitmap[pid >> 3] & (1 << (pid & 7)))
@@ -12,27 +12,146 @@ Version: 1.0.0
 
 import time
 from abc import ABC, abstractmethod
-from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Callable, List
+from collections import OrderedDict, deque
+from typing import Optional, Callable, Iterator, List, Sequence
 import heapq
+import itertools
 
 from .pcb import ProcessControlBlock
 from .states import ProcessState
 from pyos.core.config_loader import get_config
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
+
+
+class ReadyQueue:
+    """
+    FIFO queue of PCBs with O(1) removal.
+    
+    Backed by an OrderedDict keyed by PID, whose doubly-linked list is
+    implemented in C: popping either end, moving a process to the back
+    and removing a process that blocks or dies all run without Python
+    level node handling. A process is queued at most once; appending it
+    again moves it to the back.
+    """
+    
+    __slots__ = ('_items',)
+    
+    def __init__(self):
+        self._items: OrderedDict[int, ProcessControlBlock] = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __bool__(self) -> bool:
+        return bool(self._items)
+    
+    def __iter__(self):
+        return iter(self._items.values())
+    
+    def get(self, pid: int) -> Optional[ProcessControlBlock]:
+        """Get a queued process by PID."""
+        return self._items.get(pid)
+    
+    def append(self, pcb: ProcessControlBlock) -> None:
+        """Add a process at the back of the queue."""
+        items = self._items
+        pid = pcb.pid
+        items[pid] = pcb
+        items.move_to_end(pid)
+    
+    def extend(self, pcbs) -> None:
+        """Add several processes at the back of the queue."""
+        for pcb in pcbs:
+            self.append(pcb)
+    
+    def popleft(self) -> ProcessControlBlock:
+        """
+        Remove and return the process at the front of the queue.
+        
+        Raises:
+            IndexError: If the queue is empty
+        """
+        try:
+            return self._items.popitem(last=False)[1]
+        except KeyError:
+            raise IndexError("pop from an empty ready queue") from None
+    
+    def pop(self) -> ProcessControlBlock:
+        """
+        Remove and return the process at the back of the queue.
+        
+        Raises:
+            IndexError: If the queue is empty
+        """
+        try:
+            return self._items.popitem()[1]
+        except KeyError:
+            raise IndexError("pop from an empty ready queue") from None
+    
+    def discard(self, pcb: ProcessControlBlock) -> bool:
+        """
+        Remove a process if it is queued.
+        
+        Returns:
+            True if the process was removed
+        """
+        items = self._items
+        if items.get(pcb.pid) is not pcb:
+            return False
+        
+        del items[pcb.pid]
+        return True
 
 
 class SchedulerAlgorithm(ABC):
     """
     Abstract base class for scheduling algorithms.
+    
+    Subclasses drain processes handed to submit_process before they
+    enqueue, dispatch, remove or count processes, so a submitted process
+    is never queued behind one added or rescheduled after it.
     """
     
+    def __init__(self):
+        # Processes submitted without taking the scheduler's bookkeeping
+        # path; deque append/popleft are atomic, so producers need no lock
+        self._pending: deque[ProcessControlBlock] = deque()
+    
     @abstractmethod
     def add_process(self, pcb: ProcessControlBlock) -> None:
         """Add a process to the scheduler."""
         pass
     
+    def add_processes(self, pcbs: List[ProcessControlBlock]) -> None:
+        """Add several processes to the scheduler."""
+        if self._pending:
+            self._drain_pending()
+        for pcb in pcbs:
+            self.add_process(pcb)
+    
+    def submit_process(self, pcb: ProcessControlBlock) -> None:
+        """
+        Hand a process to the scheduler without queueing it yet.
+        
+        The process is added, along with everything else submitted since,
+        in one add_processes batch the next time the scheduler enqueues,
+        dispatches, removes or counts processes.
+        """
+        self._pending.append(pcb)
+    
+    def _drain_pending(self) -> None:
+        """Add all submitted processes in one batch."""
+        pending = self._pending
+        batch = []
+        try:
+            while True:
+                batch.append(pending.popleft())
+        except IndexError:
+            pass
+        if batch:
+            self.add_processes(batch)
+    
     @abstractmethod
     def remove_process(self, pcb: ProcessControlBlock) -> None:
         """Remove a process from the scheduler."""
@@ -53,6 +172,23 @@ class SchedulerAlgorithm(ABC):
         """Called when a process voluntarily yields."""
         pass
     
+    def reschedule(self, pcb: ProcessControlBlock, *, yielded: bool) -> None:
+        """
+        Return a process that has stopped running to the scheduler.
+        
+        The built-in schedulers implement time_slice_expired and
+        yield_process on top of this, so the dispatch path makes a single
+        call whichever way the process left the CPU.
+        
+        Args:
+            pcb: Process that was running
+            yielded: True if it yielded, False if its time slice expired
+        """
+        if yielded:
+            self.yield_process(pcb)
+        else:
+            self.time_slice_expired(pcb)
+    
     @abstractmethod
     def count(self) -> int:
         """Return the number of schedulable processes."""
@@ -66,6 +202,11 @@ class RoundRobinScheduler(SchedulerAlgorithm):
     Each process gets a fixed time slice (quantum). When the quantum
     expires, the process is moved to the end of the ready queue.
     
+    With num_workers > 1 the ready queue is sharded per worker: a process
+    always queues on worker pid % num_workers, and a worker whose shard
+    is empty steals from the back of a sibling's shard, leaving the
+    sibling's next-to-run processes in place.
+    
     Advantages:
     - Fair allocation of CPU time
     - Good response time for interactive processes
@@ -76,58 +217,216 @@ class RoundRobinScheduler(SchedulerAlgorithm):
     - May not be optimal for CPU-bound vs I/O-bound mix
     """
     
-    def __init__(self, quantum: int = 100):
+    def __init__(self, quantum: int = 100, num_workers: int = 1):
         """
         Initialize the Round Robin scheduler.
         
         Args:
             quantum: Time slice in milliseconds
+            num_workers: Number of workers, each with its own ready queue
+        
+        Raises:
+            ValueError: If num_workers is less than 1
         """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        
+        super().__init__()
         self.quantum = quantum
-        self.ready_queue: deque[ProcessControlBlock] = deque()
+        self.num_workers = num_workers
+        self.ready_queues: List[ReadyQueue] = [
+            ReadyQueue() for _ in range(num_workers)
+        ]
         self._logger = get_logger('scheduler_rr')
     
+    def _queue_for(self, pcb: ProcessControlBlock) -> ReadyQueue:
+        """Get the ready queue of the worker a process belongs to."""
+        return self.ready_queues[pcb.pid % self.num_workers]
+    
     def add_process(self, pcb: ProcessControlBlock) -> None:
-        """Add a process to the end of the ready queue."""
+        """Add a process to the end of its worker's ready queue."""
+        if self._pending:
+            self._drain_pending()
         pcb.time_slice = self.quantum
         pcb.time_remaining = self.quantum
-        self.ready_queue.append(pcb)
-        self._logger.debug(
-            f"Added process to queue",
-            pid=pcb.pid,
-            context={'position': len(self.ready_queue)}
-        )
+        queue = self._queue_for(pcb)
+        queue.append(pcb)
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Added process to queue",
+                pid=pcb.pid,
+                context={'position': len(queue)}
+            )
+    
+    def add_processes(self, pcbs: List[ProcessControlBlock]) -> None:
+        """Add several processes to the end of their workers' ready queues."""
+        if self._pending:
+            self._drain_pending()
+        quantum = self.quantum
+        for pcb in pcbs:
+            pcb.time_slice = quantum
+            pcb.time_remaining = quantum
+        if self.num_workers == 1:
+            self.ready_queues[0].extend(pcbs)
+        else:
+            for pcb in pcbs:
+                self._queue_for(pcb).append(pcb)
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Added processes to queue",
+                context={'count': len(pcbs), 'queue_size': self.count()}
+            )
     
     def remove_process(self, pcb: ProcessControlBlock) -> None:
         """Remove a process from the queue."""
-        try:
-            self.ready_queue.remove(pcb)
-        except ValueError:
-            pass
+        if self._pending:
+            self._drain_pending()
+        self._queue_for(pcb).discard(pcb)
     
-    def get_next_process(self) -> Optional[ProcessControlBlock]:
-        """Get the next process from the front of the queue."""
-        if self.ready_queue:
-            pcb = self.ready_queue.popleft()
+    def get_next_process(self, worker_id: int = 0) -> Optional[ProcessControlBlock]:
+        """
+        Get the next process for a worker.
+        
+        Takes the front of the worker's own queue, or steals from the back
+        of the next non-empty sibling queue when its own is empty.
+        
+        Args:
+            worker_id: Worker asking for a process
+        
+        Returns:
+            Next process, or None if every queue is empty
+        """
+        if self._pending:
+            self._drain_pending()
+        queues = self.ready_queues
+        queue = queues[worker_id]
+        if queue:
+            pcb = queue.popleft()
+        else:
+            num_workers = self.num_workers
+            for offset in range(1, num_workers):
+                victim = queues[(worker_id + offset) % num_workers]
+                if victim:
+                    pcb = victim.pop()
+                    break
+            else:
+                return None
+        
+        pcb.time_remaining = self.quantum
+        return pcb
+    
+    def reschedule(self, pcb: ProcessControlBlock, *, yielded: bool) -> None:
+        """Move a process to the end of its queue, refilling an expired quantum."""
+        if self._pending:
+            self._drain_pending()
+        if not yielded:
             pcb.time_remaining = self.quantum
-            return pcb
-        return None
+        self._queue_for(pcb).append(pcb)
     
     def time_slice_expired(self, pcb: ProcessControlBlock) -> None:
         """Move process to end of queue when quantum expires."""
-        pcb.time_remaining = self.quantum
-        self.ready_queue.append(pcb)
+        self.reschedule(pcb, yielded=False)
     
     def yield_process(self, pcb: ProcessControlBlock) -> None:
         """Process yields, goes to end of queue."""
-        self.ready_queue.append(pcb)
+        self.reschedule(pcb, yielded=True)
     
     def count(self) -> int:
         """Return number of processes in queue."""
-        return len(self.ready_queue)
+        if self._pending:
+            self._drain_pending()
+        return sum(len(queue) for queue in self.ready_queues)
+
+
+class _MultiQueueScheduler(SchedulerAlgorithm):
+    """
+    Base for schedulers with one ready queue per priority level and aging.
+    
+    Subclasses initialize:
+    - queues, ordered from highest to lowest priority, and _ready_bitmap,
+      where bit i is set while queues[i] is non-empty. The lowest set bit
+      is the highest non-empty queue, found in O(1).
+    - aging_interval_ns, _aging_heap and _aging_seq. The heap holds
+      (deadline, seq, pcb, wait start) entries; aging only looks at its
+      top, and entries whose wait start no longer matches the PCB's are
+      stale and skipped.
+    
+    Per-process state lives on the PCB itself, so no scheduling event
+    needs a PID lookup: sched_queue is the process's queue index (-1 if
+    the scheduler doesn't hold it) and sched_wait_start the
+    time.monotonic_ns() its aging wait began (-1 if not waiting).
+    """
+    
+    queues: List[ReadyQueue]
+    _ready_bitmap: int
+    aging_interval_ns: int
+    _aging_heap: List[tuple[int, int, ProcessControlBlock, int]]
+    _aging_seq: Iterator[int]
+    _aging_limit: int
+    
+    def _enqueue(self, idx: int, pcb: ProcessControlBlock) -> None:
+        """Append a process to queue idx."""
+        self.queues[idx].append(pcb)
+        self._ready_bitmap |= 1 << idx
+    
+    def _dequeue(self, idx: int, pcb: ProcessControlBlock) -> None:
+        """Remove a process from queue idx if it is there."""
+        queue = self.queues[idx]
+        if queue.discard(pcb) and not queue:
+            self._ready_bitmap &= ~(1 << idx)
+    
+    def _pop_highest(self) -> Optional[ProcessControlBlock]:
+        """Pop the front process of the highest-priority non-empty queue."""
+        bitmap = self._ready_bitmap
+        if not bitmap:
+            return None
+        
+        idx = (bitmap & -bitmap).bit_length() - 1
+        queue = self.queues[idx]
+        pcb = queue.popleft()
+        if not queue:
+            self._ready_bitmap = bitmap & ~(1 << idx)
+        return pcb
+    
+    def _start_wait(self, pcb: ProcessControlBlock, now: int) -> None:
+        """Start (or restart) a process's aging wait."""
+        pcb.sched_wait_start = now
+        heap = self._aging_heap
+        heapq.heappush(
+            heap,
+            (now + self.aging_interval_ns, next(self._aging_seq), pcb, now)
+        )
+        
+        # Drop stale entries once the heap has doubled since the last sweep
+        if len(heap) > self._aging_limit:
+            heap[:] = [entry for entry in heap
+                       if entry[2].sched_wait_start == entry[3]]
+            heapq.heapify(heap)
+            self._aging_limit = 2 * len(heap) + 64
+    
+    def _pop_aged(self, now: int) -> Sequence[ProcessControlBlock]:
+        """Pop the processes whose aging wait has expired."""
+        heap = self._aging_heap
+        if not heap or heap[0][0] >= now:
+            return ()  # Nothing due; skip building a result list
+        
+        aged = []
+        while heap and heap[0][0] < now:
+            deadline, seq, pcb, start = heapq.heappop(heap)
+            if pcb.sched_wait_start == start:
+                aged.append(pcb)
+        return aged
+    
+    def _release(self, pcb: ProcessControlBlock) -> None:
+        """Drop a process from its queue and clear its scheduler state."""
+        idx = pcb.sched_queue
+        if idx >= 0:
+            self._dequeue(idx, pcb)
+        pcb.sched_queue = -1
+        pcb.sched_wait_start = -1
 
 
-class PriorityScheduler(SchedulerAlgorithm):
+class PriorityScheduler(_MultiQueueScheduler):
     """
     Priority-based scheduling algorithm.
     
@@ -139,6 +438,12 @@ class PriorityScheduler(SchedulerAlgorithm):
     - Static priority based on process type
     - Dynamic priority adjustment (nice value)
     - Aging to prevent starvation
+    - Optional weighted round-robin across priority levels
+    
+    With weights, dispatch runs in rounds: each level may run up to its
+    weight's worth of processes per round, highest level first, so lower
+    levels get a guaranteed share instead of waiting for higher ones to
+    empty.
     """
     
     def __init__(
@@ -146,7 +451,8 @@ class PriorityScheduler(SchedulerAlgorithm):
         quantum: int = 100,
         priority_levels: int = 40,
         enable_aging: bool = True,
-        aging_interval: float = 5.0
+        aging_interval: float = 5.0,
+        weights: Optional[Sequence[int]] = None
     ):
         """
         Initialize the Priority scheduler.
@@ -156,22 +462,80 @@ class PriorityScheduler(SchedulerAlgorithm):
             priority_levels: Number of priority levels
             enable_aging: Enable aging to prevent starvation
             aging_interval: Seconds before priority boost
+            weights: Dispatches per round for each priority level, or
+                None for strict priority order
+        
+        Raises:
+            ValueError: If weights doesn't have one positive weight per level
         """
+        if weights is not None:
+            if len(weights) != priority_levels or min(weights) < 1:
+                raise ValueError(
+                    f"weights must be {priority_levels} positive integers"
+                )
+        
+        super().__init__()
         self.quantum = quantum
         self.priority_levels = priority_levels
         self.enable_aging = enable_aging
         self.aging_interval = aging_interval
+        self.aging_interval_ns = int(aging_interval * 1e9)
         
         # Queue for each priority level
-        self.queues: List[deque[ProcessControlBlock]] = [
-            deque() for _ in range(priority_levels)
+        self.queues: List[ReadyQueue] = [
+            ReadyQueue() for _ in range(priority_levels)
         ]
+        self._ready_bitmap = 0
+        
+        # Aging deadlines; heap entries carry the PCB, so no PID lookup
+        self._aging_heap: List[tuple[int, int, ProcessControlBlock, int]] = []
+        self._aging_seq = itertools.count()
+        self._aging_limit = 64
         
-        # Track wait times for aging
-        self._wait_times: dict[int, float] = {}
+        # Weighted round-robin: credits left this round per level, a mask
+        # of levels with credits left, and the level being served
+        self._weights: Optional[tuple[int, ...]] = (
+            tuple(weights) if weights is not None else None
+        )
+        self._credits: List[int] = list(weights) if weights is not None else []
+        self._credit_mask = (1 << priority_levels) - 1
+        self._cursor = 0
         
         self._logger = get_logger('scheduler_priority')
     
+    def _pop_weighted(self) -> Optional[ProcessControlBlock]:
+        """Pop the next process in weighted round-robin order."""
+        bitmap = self._ready_bitmap
+        if not bitmap:
+            return None
+        
+        eligible = bitmap & self._credit_mask
+        if not eligible:
+            # Every non-empty level has spent its credits; start a round
+            self._credits = list(self._weights)
+            self._credit_mask = (1 << self.priority_levels) - 1
+            self._cursor = 0
+            eligible = bitmap
+        
+        # Keep serving from the cursor onwards, wrapping to the top
+        cursor = self._cursor
+        ahead = eligible >> cursor << cursor
+        if ahead:
+            eligible = ahead
+        idx = (eligible & -eligible).bit_length() - 1
+        self._cursor = idx
+        
+        credits = self._credits
+        credits[idx] -= 1
+        if not credits[idx]:
+            self._credit_mask &= ~(1 << idx)
+        
+        queue = self.queues[idx]
+        pcb = queue.popleft()
+        if not queue:
+            self._ready_bitmap = bitmap & ~(1 << idx)
+        return pcb
+    
     def _get_priority_index(self, pcb: ProcessControlBlock) -> int:
         """Get the queue index for a process priority."""
         # Priority ranges from 0 (highest) to priority_levels-1 (lowest)
@@ -180,43 +544,62 @@ class PriorityScheduler(SchedulerAlgorithm):
     
     def add_process(self, pcb: ProcessControlBlock) -> None:
         """Add a process to the appropriate priority queue."""
+        if self._pending:
+            self._drain_pending()
         idx = self._get_priority_index(pcb)
+        old_idx = pcb.sched_queue
+        if old_idx >= 0 and old_idx != idx:
+            # Requeued after a priority change; leave the old queue
+            self._dequeue(old_idx, pcb)
+        pcb.sched_queue = idx
         pcb.time_slice = self.quantum
         pcb.time_remaining = self.quantum
         
-        self.queues[idx].append(pcb)
+        self._enqueue(idx, pcb)
         
         if self.enable_aging:
-            self._wait_times[pcb.pid] = time.time()
+            self._start_wait(pcb, time.monotonic_ns())
         
-        self._logger.debug(
-            f"Added process to priority queue",
-            pid=pcb.pid,
-            context={'priority': idx, 'queue_size': len(self.queues[idx])}
-        )
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Added process to priority queue",
+                pid=pcb.pid,
+                context={'priority': idx, 'queue_size': len(self.queues[idx])}
+            )
     
     def remove_process(self, pcb: ProcessControlBlock) -> None:
         """Remove a process from its priority queue."""
-        idx = self._get_priority_index(pcb)
-        try:
-            self.queues[idx].remove(pcb)
-        except ValueError:
-            pass
-        
-        self._wait_times.pop(pcb.pid, None)
+        if self._pending:
+            self._drain_pending()
+        # The queue recorded at enqueue time, so a priority or nice change
+        # while queued can't send the removal to the wrong queue
+        self._release(pcb)
     
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get the highest priority ready process."""
-        self._apply_aging()
-        
-        for queue in self.queues:
-            if queue:
-                pcb = queue.popleft()
-                pcb.time_remaining = pcb.time_slice
-                self._wait_times.pop(pcb.pid, None)
-                return pcb
+        if self._pending:
+            self._drain_pending()
+        # The heap top is the earliest deadline, so unless it has passed
+        # no process can be aged and the aging pass is skipped entirely
+        heap = self._aging_heap
+        if heap:
+            now = time.monotonic_ns()
+            if heap[0][0] < now:
+                self._apply_aging(now)
         
-        return None
+        if self._weights is None:
+            pcb = self._pop_highest()
+        else:
+            pcb = self._pop_weighted()
+        if pcb is not None:
+            pcb.time_remaining = pcb.time_slice
+            pcb.sched_queue = -1
+            pcb.sched_wait_start = -1
+        return pcb
+    
+    def reschedule(self, pcb: ProcessControlBlock, *, yielded: bool) -> None:
+        """Return a process to its priority queue, however it stopped."""
+        self.add_process(pcb)
     
     def time_slice_expired(self, pcb: ProcessControlBlock) -> None:
         """Return process to its priority queue."""
@@ -226,35 +609,39 @@ class PriorityScheduler(SchedulerAlgorithm):
         """Process yields, returns to queue."""
         self.add_process(pcb)
     
-    def _apply_aging(self) -> None:
+    def _apply_aging(self, current_time: int) -> None:
         """Apply aging to prevent starvation."""
-        if not self.enable_aging:
-            return
-        
-        current_time = time.time()
-        
-        for pid, wait_start in list(self._wait_times.items()):
-            wait_time = current_time - wait_start
-            if wait_time > self.aging_interval:
-                # Find the process and boost its priority
-                for queue in self.queues:
-                    for pcb in queue:
-                        if pcb.pid == pid:
-                            # Decrease priority value (increase actual priority)
-                            pcb.priority = max(0, pcb.priority - 1)
-                            self._logger.debug(
-                                f"Applied aging boost",
-                                pid=pid,
-                                context={'new_priority': pcb.priority}
-                            )
-                            break
+        log_debug = self._logger.is_enabled_for(LogLevel.DEBUG)
+        start_wait = self._start_wait
+        
+        for pcb in self._pop_aged(current_time):
+            # Decrease priority value (increase actual priority), moving
+            # the process to its new queue if the boost changes it
+            old_idx = pcb.sched_queue
+            pcb.priority = max(0, pcb.priority - 1)
+            new_idx = self._get_priority_index(pcb)
+            if new_idx != old_idx:
+                self._dequeue(old_idx, pcb)
+                self._enqueue(new_idx, pcb)
+                pcb.sched_queue = new_idx
+            
+            # Restart the wait so the next boost needs another interval
+            start_wait(pcb, current_time)
+            if log_debug:
+                self._logger.debug(
+                    f"Applied aging boost",
+                    pid=pcb.pid,
+                    context={'new_priority': pcb.priority}
+                )
     
     def count(self) -> int:
         """Return total number of processes in all queues."""
+        if self._pending:
+            self._drain_pending()
         return sum(len(q) for q in self.queues)
 
 
-class MultiLevelFeedbackQueueScheduler(SchedulerAlgorithm):
+class MultiLevelFeedbackQueueScheduler(_MultiQueueScheduler):
     """
     Multi-Level Feedback Queue (MLFQ) scheduler.
     
@@ -283,120 +670,141 @@ class MultiLevelFeedbackQueueScheduler(SchedulerAlgorithm):
             quantum_multiplier: Quantum multiplier for each lower level
             aging_interval: Seconds before priority boost
         """
+        super().__init__()
         self.num_queues = num_queues
         self.base_quantum = base_quantum
         self.quantum_multiplier = quantum_multiplier
         self.aging_interval = aging_interval
+        self.aging_interval_ns = int(aging_interval * 1e9)
         
         # Create queues with increasing time slices
-        self.queues: List[deque[ProcessControlBlock]] = [
-            deque() for _ in range(num_queues)
+        self.queues: List[ReadyQueue] = [
+            ReadyQueue() for _ in range(num_queues)
         ]
-        self.quantums = [
+        self._ready_bitmap = 0
+        self.quantums: tuple[int, ...] = tuple(
             int(base_quantum * (quantum_multiplier ** i))
             for i in range(num_queues)
-        ]
+        )
+        self._last_idx = num_queues - 1  # Lowest queue; demotion stops here
         
-        # Track which queue each process is in
-        self._process_queue: dict[int, int] = {}
-        self._wait_times: dict[int, float] = {}
+        # Aging deadlines; heap entries carry the PCB, so no PID lookup
+        self._aging_heap: List[tuple[int, int, ProcessControlBlock, int]] = []
+        self._aging_seq = itertools.count()
+        self._aging_limit = 64
         
         self._logger = get_logger('scheduler_mlfq')
     
     def add_process(self, pcb: ProcessControlBlock) -> None:
         """Add a new process to the highest priority queue."""
+        if self._pending:
+            self._drain_pending()
         queue_idx = 0
         pcb.time_slice = self.quantums[queue_idx]
         pcb.time_remaining = pcb.time_slice
         
-        self.queues[queue_idx].append(pcb)
-        self._process_queue[pcb.pid] = queue_idx
-        self._wait_times[pcb.pid] = time.time()
+        old_idx = pcb.sched_queue
+        if old_idx > queue_idx:
+            self._dequeue(old_idx, pcb)
+        pcb.sched_queue = queue_idx
+        
+        self._enqueue(queue_idx, pcb)
+        self._start_wait(pcb, time.monotonic_ns())
     
     def remove_process(self, pcb: ProcessControlBlock) -> None:
         """Remove a process from its queue."""
-        queue_idx = self._process_queue.pop(pcb.pid, -1)
-        if 0 <= queue_idx < self.num_queues:
-            try:
-                self.queues[queue_idx].remove(pcb)
-            except ValueError:
-                pass
-        self._wait_times.pop(pcb.pid, None)
+        if self._pending:
+            self._drain_pending()
+        self._release(pcb)
     
     def get_next_process(self) -> Optional[ProcessControlBlock]:
         """Get the next process from the highest priority non-empty queue."""
-        self._apply_aging()
-        
-        for idx, queue in enumerate(self.queues):
-            if queue:
-                pcb = queue.popleft()
-                pcb.time_remaining = pcb.time_slice
-                self._wait_times.pop(pcb.pid, None)
-                return pcb
+        if self._pending:
+            self._drain_pending()
+        # The heap top is the earliest deadline, so unless it has passed
+        # no process can be aged and the aging pass is skipped entirely
+        heap = self._aging_heap
+        if heap:
+            now = time.monotonic_ns()
+            if heap[0][0] < now:
+                self._apply_aging(now)
         
-        return None
+        pcb = self._pop_highest()
+        if pcb is not None:
+            pcb.time_remaining = pcb.time_slice
+            pcb.sched_wait_start = -1  # Keeps its level for reschedule
+        return pcb
     
-    def time_slice_expired(self, pcb: ProcessControlBlock) -> None:
+    def reschedule(self, pcb: ProcessControlBlock, *, yielded: bool) -> None:
         """
-        Process used full time slice, demote to lower priority.
+        Requeue a process that has stopped running.
         
-        This indicates a CPU-bound process.
+        A process that used its full time slice is CPU-bound and is
+        demoted to a lower priority; one that yielded early is I/O-bound
+        and keeps its current queue.
         """
-        current_idx = self._process_queue.get(pcb.pid, 0)
+        if self._pending:
+            self._drain_pending()
         
-        # Demote to lower priority (higher index)
-        new_idx = min(current_idx + 1, self.num_queues - 1)
-        pcb.time_slice = self.quantums[new_idx]
-        pcb.time_remaining = pcb.time_slice
+        # A process this scheduler hasn't seen starts in the top queue
+        current_idx = max(pcb.sched_queue, 0)
         
-        self.queues[new_idx].append(pcb)
-        self._process_queue[pcb.pid] = new_idx
-        self._wait_times[pcb.pid] = time.time()
+        if yielded:
+            new_idx = current_idx
+        else:
+            # Demote to lower priority (higher index)
+            new_idx = min(current_idx + 1, self._last_idx)
+            quantum = self.quantums[new_idx]
+            pcb.time_slice = quantum
+            pcb.time_remaining = quantum
+        pcb.sched_queue = new_idx
         
-        self._logger.debug(
-            f"Demoted process",
-            pid=pcb.pid,
-            context={'old_queue': current_idx, 'new_queue': new_idx}
-        )
+        self._enqueue(new_idx, pcb)
+        self._start_wait(pcb, time.monotonic_ns())
+        
+        if not yielded and self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(
+                f"Demoted process",
+                pid=pcb.pid,
+                context={'old_queue': current_idx, 'new_queue': new_idx}
+            )
+    
+    def time_slice_expired(self, pcb: ProcessControlBlock) -> None:
+        """Process used full time slice, demote to lower priority."""
+        self.reschedule(pcb, yielded=False)
     
     def yield_process(self, pcb: ProcessControlBlock) -> None:
-        """
-        Process yielded before time slice expired.
-        
-        This indicates an I/O-bound process, keep in current queue.
-        """
-        current_idx = self._process_queue.get(pcb.pid, 0)
-        self.queues[current_idx].append(pcb)
-        self._wait_times[pcb.pid] = time.time()
+        """Process yielded before time slice expired, keep its queue."""
+        self.reschedule(pcb, yielded=True)
     
-    def _apply_aging(self) -> None:
+    def _apply_aging(self, current_time: int) -> None:
         """Boost priority of processes that have waited too long."""
-        current_time = time.time()
-        
-        for pid, wait_start in list(self._wait_times.items()):
-            wait_time = current_time - wait_start
-            if wait_time > self.aging_interval:
-                # Boost to highest priority
-                current_idx = self._process_queue.get(pid, -1)
-                if current_idx > 0:
-                    # Find and move the process
-                    for pcb in self.queues[current_idx]:
-                        if pcb.pid == pid:
-                            self.queues[current_idx].remove(pcb)
-                            self.queues[0].append(pcb)
-                            self._process_queue[pid] = 0
-                            pcb.time_slice = self.quantums[0]
-                            
-                            self._logger.debug(
-                                f"Boosted process priority",
-                                pid=pid,
-                                context={'old_queue': current_idx, 'new_queue': 0}
-                            )
-                            break
-                self._wait_times[pid] = current_time
+        log_debug = self._logger.is_enabled_for(LogLevel.DEBUG)
+        top_quantum = self.quantums[0]
+        start_wait = self._start_wait
+        
+        for pcb in self._pop_aged(current_time):
+            # Boost to highest priority
+            current_idx = pcb.sched_queue
+            if current_idx > 0:
+                # Move the process to the top queue
+                self._dequeue(current_idx, pcb)
+                self._enqueue(0, pcb)
+                pcb.sched_queue = 0
+                pcb.time_slice = top_quantum
+                
+                if log_debug:
+                    self._logger.debug(
+                        f"Boosted process priority",
+                        pid=pcb.pid,
+                        context={'old_queue': current_idx, 'new_queue': 0}
+                    )
+            start_wait(pcb, current_time)
     
     def count(self) -> int:
         """Return total number of processes."""
+        if self._pending:
+            self._drain_pending()
         return sum(len(q) for q in self.queues)
     
     def get_queue_stats(self) -> List[dict]:
@@ -411,22 +819,54 @@ class MultiLevelFeedbackQueueScheduler(SchedulerAlgorithm):
         ]
 
 
-def create_scheduler(algorithm: str = "round_robin", **kwargs) -> SchedulerAlgorithm:
+# Scheduler classes by algorithm name, used by create_scheduler
+_SCHEDULER_REGISTRY: dict[str, type[SchedulerAlgorithm]] = {
+    'round_robin': RoundRobinScheduler,
+    'priority': PriorityScheduler,
+    'mlfq': MultiLevelFeedbackQueueScheduler,
+}
+
+
+def register_scheduler(name: str, scheduler_class: type[SchedulerAlgorithm]) -> None:
+    """
+    Register a scheduler class for create_scheduler.
+    
+    Args:
+        name: Algorithm name passed to create_scheduler
+        scheduler_class: SchedulerAlgorithm subclass to instantiate
+    
+    Raises:
+        TypeError: If scheduler_class is not a SchedulerAlgorithm subclass
+    """
+    if not (isinstance(scheduler_class, type)
+            and issubclass(scheduler_class, SchedulerAlgorithm)):
+        raise TypeError(f"{scheduler_class!r} is not a SchedulerAlgorithm subclass")
+    _SCHEDULER_REGISTRY[name] = scheduler_class
+
+
+def create_scheduler(
+    algorithm: str = "round_robin",
+    num_workers: int = 1,
+    **kwargs
+) -> SchedulerAlgorithm:
     """
     Factory function to create a scheduler.
     
     Args:
-        algorithm: Scheduler type ('round_robin', 'priority', 'mlfq')
+        algorithm: Scheduler type ('round_robin', 'priority', 'mlfq', or
+            a name added with register_scheduler)
+        num_workers: Number of per-worker ready queues (round_robin only)
         **kwargs: Additional arguments for the scheduler
     
     Returns:
         Scheduler instance
-    """
-    schedulers = {
-        'round_robin': RoundRobinScheduler,
-        'priority': PriorityScheduler,
-        'mlfq': MultiLevelFeedbackQueueScheduler,
-    }
     
-    scheduler_class = schedulers.get(algorithm, RoundRobinScheduler)
+    Raises:
+        ValueError: If num_workers > 1 for a scheduler without sharding
+    """
+    scheduler_class = _SCHEDULER_REGISTRY.get(algorithm, RoundRobinScheduler)
+    if issubclass(scheduler_class, RoundRobinScheduler):
+        kwargs['num_workers'] = num_workers
+    elif num_workers != 1:
+        raise ValueError(f"Scheduler '{algorithm}' does not support num_workers")
     return scheduler_class(**kwargs)
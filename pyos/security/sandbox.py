@@ -11,44 +11,293 @@ Author: YSNRFD
 Version: 1.0.0
 """
 
+import itertools
+import os
 import threading
+import time
+from array import array
+from collections.abc import MutableSet
 from dataclasses import dataclass, field
-from typing import Optional, Any, Callable, List
+from typing import Optional, Any, Callable, Iterable, Iterator, List
 from enum import Enum
 
 from pyos.core.registry import Subsystem, SubsystemState
 from pyos.core.config_loader import get_config
+from pyos.filesystem.path_resolver import PathResolver
 from pyos.exceptions import (
     SecurityViolationError,
     SandboxViolationError,
     PolicyViolationError,
     ResourceLimitExceeded,
 )
-from pyos.logger import Logger, get_logger
+from pyos.logger import Logger, LogLevel, get_logger
+
+
+# Bound once, so timestamping an audit event is a single global lookup
+_now = time.time
 
 
 class ResourceType(Enum):
-    """Types of resources that can be limited."""
+    """
+    Types of resources that can be limited.
+    
+    Each member's index is its position in ResourceLimits.as_tuple().
+    """
     CPU_TIME = "cpu_time"
     MEMORY = "memory"
     FILE_DESCRIPTORS = "file_descriptors"
     PROCESSES = "processes"
     FILES = "files"
     PIPES = "pipes"
+    
+    def __new__(cls, value: str):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = len(cls.__members__)
+        return member
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceLimits:
-    """Resource limits for a process or user."""
+    """
+    Resource limits for a process or user.
+    
+    Immutable, so the limits can be precomputed as a tuple indexed by
+    ResourceType.index.
+    """
     cpu_time: int = 3600  # seconds
     memory: int = 16 * 1024 * 1024  # bytes
     file_descriptors: int = 1024
     processes: int = 256
     files: int = 1024
     pipes: int = 256
+    _values: tuple[int, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_values', (
+            self.cpu_time, self.memory, self.file_descriptors,
+            self.processes, self.files, self.pipes,
+        ))
+    
+    def as_tuple(self) -> tuple[int, ...]:
+        """Get the limits in ResourceType order."""
+        return self._values
+
+
+# Shared by every sandbox created without explicit limits (safe, since
+# ResourceLimits is immutable)
+_DEFAULT_LIMITS = ResourceLimits()
+
+
+# Rules stored in a _PrefixMatcher trie node, under the _RULE key (path
+# segments are never empty, so it can't collide with a child)
+_RULE = ''
+_ALLOW = 1
+_DENY = 2
+
+
+class _PrefixMatcher:
+    """
+    Trie of a sandbox's denied and allowed path prefixes, keyed by path
+    segment, so a path is matched in one walk instead of a startswith scan
+    per rule.
+    
+    Prefixes match whole segments: '/tmp' covers '/tmp' and '/tmp/x' but
+    not '/tmpx'. A denied prefix anywhere along the path wins over an
+    allowed one. Rules are normalized once when the trie is built, and
+    paths only when they contain '.' or '..' segments, so '/tmp/../etc'
+    is matched as '/etc'. Only absolute paths are matched: a relative path
+    or rule has no fixed place in the tree, so a relative path matches
+    nothing (and is denied) and relative rules are ignored.
+    
+    Results are memoized per path. A matcher is rebuilt whenever the rules
+    change, so the cache never outlives the rules it was filled from.
+    """
+    
+    CACHE_SIZE = 1024  # Paths memoized before the cache is reset
+    
+    __slots__ = ('source', '_root', '_cache', '_prefixes')
+    
+    def __init__(self, denied_paths: List[str], allowed_paths: List[str]):
+        # Copies of the rule lists, so the sandbox can detect changes
+        self.source = (list(denied_paths), list(allowed_paths))
+        self._root: dict = {}
+        self._cache: dict[str, int] = {}
+        prefixes = set()
+        for rule, paths in ((_ALLOW, allowed_paths), (_DENY, denied_paths)):
+            for path in paths:
+                if path.startswith('/'):
+                    prefixes.add(self._insert(path, rule))
+        # Every rule as a normalized absolute path, for a startswith filter
+        self._prefixes = tuple(prefixes)
+    
+    def _insert(self, path: str, rule: int) -> str:
+        """
+        Add a rule for a path prefix.
+        
+        Returns:
+            The prefix as a normalized absolute path
+        """
+        node = self._root
+        parts = [part for part in PathResolver.normalize(path).split('/') if part]
+        for part in parts:
+            node = node.setdefault(part, {})
+        if node.get(_RULE) != _DENY:
+            node[_RULE] = rule
+        return '/' + '/'.join(parts)
+    
+    def match(self, path: str) -> int:
+        """
+        Match a path against the rules.
+        
+        Returns:
+            _DENY if a denied prefix matches, otherwise _ALLOW if an
+            allowed prefix matches, otherwise 0
+        """
+        cache = self._cache
+        result = cache.get(path)
+        if result is None:
+            if len(cache) >= self.CACHE_SIZE:
+                cache.clear()
+            result = cache[path] = self._walk(path)
+        return result
+    
+    def _walk(self, path: str) -> int:
+        """Match a path by walking the trie."""
+        if not path.startswith('/'):
+            return 0
+        if '/.' in path or '//' in path:
+            path = PathResolver.normalize(path)
+        
+        node = self._root
+        result = node.get(_RULE, 0)
+        if result == _DENY:
+            return _DENY
+        
+        # A normalized absolute path can only reach a rule it starts with,
+        # so one C-level startswith rejects paths outside every rule
+        if not path.startswith(self._prefixes):
+            return result
+        
+        for part in path.split('/'):
+            if not part:
+                continue
+            node = node.get(part)
+            if node is None:
+                break
+            rule = node.get(_RULE)
+            if rule == _DENY:
+                return _DENY
+            if rule:
+                result = _ALLOW
+        return result
+
+
+class SyscallSet(MutableSet):
+    """
+    A set of syscall numbers stored as an int bitmap.
+    
+    Syscall numbers are small and non-negative, so bit n of mask records
+    whether n is in the set. check_syscall tests the mask directly, one
+    shift and mask instead of a hash lookup, and the mask can never fall
+    out of step with the set because it is the set.
+    """
+    
+    __slots__ = ('mask',)
+    
+    def __init__(self, syscalls: Iterable[int] = ()):
+        self.mask = 0
+        self.update(syscalls)
+    
+    def __contains__(self, number: object) -> bool:
+        return isinstance(number, int) and number >= 0 and bool(self.mask >> number & 1)
+    
+    def __iter__(self) -> Iterator[int]:
+        mask = self.mask
+        number = 0
+        while mask:
+            if mask & 1:
+                yield number
+            mask >>= 1
+            number += 1
+    
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+    
+    def add(self, number: int) -> None:
+        if number < 0:
+            raise ValueError(f"Invalid syscall number: {number}")
+        self.mask |= 1 << number
+    
+    def discard(self, number: int) -> None:
+        if 0 <= number:
+            self.mask &= ~(1 << number)
+    
+    def update(self, syscalls: Iterable[int]) -> None:
+        for number in syscalls:
+            self.add(number)
+    
+    def difference_update(self, syscalls: Iterable[int]) -> None:
+        for number in syscalls:
+            self.discard(number)
+    
+    def clear(self) -> None:
+        self.mask = 0
+    
+    def __repr__(self) -> str:
+        return f"SyscallSet({list(self)!r})"
+
+
+# Verdicts returned by a compiled syscall check
+_SYSCALL_OK = 0
+_SYSCALL_DENIED = 1
+_SYSCALL_NOT_ALLOWED = 2
+
+# (audit reason, error message template) for each kind of sandbox denial
+_PATH_DENIED = ("Path in denied list", "Access to {} is denied")
+_PATH_NOT_ALLOWED = ("Path not in allowed list", "Access to {} is not allowed")
+_SYSCALL_DENIALS = (
+    None,  # _SYSCALL_OK
+    ("Syscall in denied list", "Syscall {} is denied"),
+    ("Syscall not in allowed list", "Syscall {} is not allowed"),
+)
 
 
-@dataclass
+def _compile_syscall_check(denied: int, allowed: int) -> Callable[[int], int]:
+    """
+    Build a syscall check specialized for a pair of syscall bitmaps.
+    
+    Branches that are constant for the sandbox, such as an empty allow
+    list, are decided here once rather than on every call.
+    
+    Args:
+        denied: Bitmap of denied syscalls
+        allowed: Bitmap of allowed syscalls, 0 to allow everything
+    
+    Returns:
+        Function mapping a syscall number to a _SYSCALL_* verdict
+    """
+    if not allowed:
+        if not denied:
+            return lambda number: _SYSCALL_OK
+        return lambda number: denied >> number & 1
+    
+    if not denied:
+        return lambda number: (
+            _SYSCALL_OK if allowed >> number & 1 else _SYSCALL_NOT_ALLOWED
+        )
+    
+    def check(number: int) -> int:
+        if denied >> number & 1:
+            return _SYSCALL_DENIED
+        return _SYSCALL_OK if allowed >> number & 1 else _SYSCALL_NOT_ALLOWED
+    
+    return check
+
+
+@dataclass(slots=True)
 class Sandbox:
     """
     A sandbox for restricting process capabilities.
@@ -63,13 +312,54 @@ class Sandbox:
     pid: int
     allowed_paths: List[str] = field(default_factory=lambda: ['/tmp'])
     denied_paths: List[str] = field(default_factory=list)
-    allowed_syscalls: set[int] = field(default_factory=set)
-    denied_syscalls: set[int] = field(default_factory=set)
-    limits: ResourceLimits = field(default_factory=ResourceLimits)
+    allowed_syscalls: SyscallSet = field(default_factory=SyscallSet)
+    denied_syscalls: SyscallSet = field(default_factory=SyscallSet)
+    limits: ResourceLimits = _DEFAULT_LIMITS
     enabled: bool = True
+    _matcher: Optional[_PrefixMatcher] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _syscall_masks: Optional[tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _syscall_check: Optional[Callable[[int], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._coerce_syscall_sets()
+    
+    def _coerce_syscall_sets(self) -> None:
+        """Wrap plain sets of syscall numbers in SyscallSet."""
+        if not isinstance(self.allowed_syscalls, SyscallSet):
+            self.allowed_syscalls = SyscallSet(self.allowed_syscalls)
+        if not isinstance(self.denied_syscalls, SyscallSet):
+            self.denied_syscalls = SyscallSet(self.denied_syscalls)
+    
+    def path_matcher(self) -> _PrefixMatcher:
+        """Get the path trie, rebuilding it if the path lists changed."""
+        matcher = self._matcher
+        if matcher is None or matcher.source != (self.denied_paths, self.allowed_paths):
+            matcher = self._matcher = _PrefixMatcher(
+                self.denied_paths, self.allowed_paths
+            )
+        return matcher
+    
+    def syscall_checker(self) -> Callable[[int], int]:
+        """Get the compiled syscall check, rebuilding it if the sets changed."""
+        try:
+            masks = (self.denied_syscalls.mask, self.allowed_syscalls.mask)
+        except AttributeError:
+            # A plain set was assigned to one of the fields after construction
+            self._coerce_syscall_sets()
+            masks = (self.denied_syscalls.mask, self.allowed_syscalls.mask)
+        if masks != self._syscall_masks:
+            self._syscall_check = _compile_syscall_check(*masks)
+            self._syscall_masks = masks
+        return self._syscall_check
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     """A security policy rule."""
     name: str
@@ -78,6 +368,112 @@ class Policy:
     action: str = "deny"  # "deny", "allow", "log"
 
 
+class _AuditRing:
+    """
+    Fixed-size ring of audit events, stored column by column.
+    
+    Timestamps, PIDs and repeat counts live in typed arrays and the
+    strings in parallel lists, so an event costs a few slots rather than
+    a dict. Dicts are built only for the events a caller asks for.
+    """
+    
+    __slots__ = (
+        'size', 'total', '_count', '_next', '_timestamps', '_pids',
+        '_repeats', '_actions', '_resources', '_results', '_reasons',
+    )
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.total = 0  # Events ever appended, including overwritten ones
+        self._count = 0
+        self._next = 0  # Slot the next event is written to
+        self._timestamps = array('d', bytes(8 * size))
+        self._pids = array('q', bytes(8 * size))
+        self._repeats = array('q', bytes(8 * size))
+        self._actions: List[str] = [''] * size
+        self._resources: List[str] = [''] * size
+        self._results: List[str] = [''] * size
+        self._reasons: List[str] = [''] * size
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(
+        self,
+        timestamp: float,
+        pid: int,
+        action: str,
+        resource: str,
+        result: str,
+        reason: str
+    ) -> None:
+        """Add an event, overwriting the oldest once the ring is full."""
+        i = self._next
+        self._timestamps[i] = timestamp
+        self._pids[i] = pid
+        self._repeats[i] = 1
+        self._actions[i] = action
+        self._resources[i] = resource
+        self._results[i] = result
+        self._reasons[i] = reason
+        self._next = (i + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+        self.total += 1
+    
+    def repeat_last(
+        self,
+        timestamp: float,
+        pid: int,
+        action: str,
+        resource: str,
+        result: str,
+        reason: str
+    ) -> bool:
+        """
+        Count a repeat of the newest event, if it is identical.
+        
+        Returns:
+            True if the newest event matched and was updated
+        """
+        if not self._count:
+            return False
+        i = self._next - 1  # -1 wraps to the last slot
+        if (self._resources[i] == resource and self._pids[i] == pid
+                and self._actions[i] == action and self._results[i] == result
+                and self._reasons[i] == reason):
+            self._repeats[i] += 1
+            self._timestamps[i] = timestamp
+            return True
+        return False
+    
+    def events(self, limit: int) -> List[dict[str, Any]]:
+        """Get up to limit of the newest events as dicts, oldest first."""
+        count = min(limit, self._count)
+        if count <= 0:
+            return []
+        
+        size = self.size
+        first = self._next - count
+        return [
+            {
+                'timestamp': self._timestamps[i],
+                'pid': self._pids[i],
+                'action': self._actions[i],
+                'resource': self._resources[i],
+                'result': self._results[i],
+                'reason': self._reasons[i],
+                'repeats': self._repeats[i],
+            }
+            for i in (j % size for j in range(first, first + count))
+        ]
+    
+    def clear(self) -> None:
+        """Drop all events."""
+        self._count = 0
+        self._next = 0
+
+
 class SecurityManager(Subsystem):
     """
     Security Management Subsystem.
@@ -93,12 +489,34 @@ class SecurityManager(Subsystem):
         >>> security.create_sandbox(pid=42, limits=ResourceLimits(memory=1024*1024))
     """
     
+    POLICY_REORDER_INTERVAL = 1024  # Policy checks between reorders
+    AUDIT_LOG_SIZE = 1000  # Recent events kept for get_audit_log
+    AUDIT_FLUSH_INTERVAL = 1.0  # Seconds between audit flushes
+    AUDIT_BATCH_SIZE = 256  # Pending events that trigger an early flush
+    AUDIT_ALLOW_SAMPLE = 0  # Audit one in this many allows (0: denials only)
+    
     def __init__(self):
         super().__init__('security')
+        # Copy-on-write: writers build a new dict under _lock and swap it
+        # in, so the check paths read it without locking. Most processes
+        # run unsandboxed, so the checks return early while it is empty
         self._sandboxes: dict[int, Sandbox] = {}
         self._policies: List[Policy] = []
-        self._audit_log: List[dict[str, Any]] = []
-        self._next_sandbox_id = 1
+        self._policy_fn: Optional[Callable[[dict], Optional[Policy]]] = None
+        self._policy_hits: dict[str, int] = {}  # Violations per policy name
+        self._policy_checks = 0
+        self._audit_log = _AuditRing(self.AUDIT_LOG_SIZE)
+        self._audit_lock = threading.Lock()  # Guards _audit_log and _audit_flushed
+        self._allowed_count = 0  # Allowed checks, audited or not
+        
+        # Audit log total at the last flush. Events past it wait for the
+        # flush thread to write them to the logger in one batch; ones the
+        # ring overwrites before then are dropped.
+        self._audit_flushed = 0
+        self._audit_wakeup = threading.Event()
+        self._audit_thread: Optional[threading.Thread] = None
+        self._audit_running = False
+        self._next_sandbox_id = itertools.count(1).__next__  # Atomic under the GIL
         self._lock = threading.Lock()
     
     def initialize(self) -> None:
@@ -140,19 +558,37 @@ class SecurityManager(Subsystem):
             ),
             action="deny"
         ))
+        self._policy_fn = None
     
     def start(self) -> None:
         """Start the security manager."""
+        if not self._audit_running:
+            self._audit_running = True
+            self._audit_wakeup.clear()
+            self._audit_thread = threading.Thread(
+                target=self._run_audit_flush, daemon=True
+            )
+            self._audit_thread.start()
         self.set_state(SubsystemState.RUNNING)
     
     def stop(self) -> None:
         """Stop the security manager."""
+        if self._audit_running:
+            self._audit_running = False
+            self._audit_wakeup.set()
+            if self._audit_thread and self._audit_thread.is_alive():
+                self._audit_thread.join(timeout=2.0)
+            self._audit_thread = None
+        self._flush_audit()
         self.set_state(SubsystemState.STOPPED)
     
     def cleanup(self) -> None:
         """Clean up resources."""
-        self._sandboxes.clear()
-        self._audit_log.clear()
+        with self._lock:
+            self._sandboxes = {}
+        with self._audit_lock:
+            self._audit_log.clear()
+            self._audit_flushed = self._audit_log.total
     
     def create_sandbox(
         self,
@@ -171,26 +607,27 @@ class SecurityManager(Subsystem):
         Returns:
             Created Sandbox
         """
+        sandbox_id = self._next_sandbox_id()
+        sandbox = Sandbox(
+            sandbox_id=sandbox_id,
+            pid=pid,
+            limits=limits or self._default_limits,
+            allowed_paths=allowed_paths or ['/tmp', '/home']
+        )
+        
         with self._lock:
-            sandbox_id = self._next_sandbox_id
-            self._next_sandbox_id += 1
-            
-            sandbox = Sandbox(
-                sandbox_id=sandbox_id,
-                pid=pid,
-                limits=limits or self._default_limits,
-                allowed_paths=allowed_paths or ['/tmp', '/home']
-            )
-            
-            self._sandboxes[pid] = sandbox
-            
+            sandboxes = dict(self._sandboxes)
+            sandboxes[pid] = sandbox
+            self._sandboxes = sandboxes
+        
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
             self._logger.debug(
                 f"Created sandbox",
                 pid=pid,
                 context={'sandbox_id': sandbox_id}
             )
-            
-            return sandbox
+        
+        return sandbox
     
     def get_sandbox(self, pid: int) -> Optional[Sandbox]:
         """Get a process's sandbox."""
@@ -198,15 +635,18 @@ class SecurityManager(Subsystem):
     
     def remove_sandbox(self, pid: int) -> bool:
         """Remove a sandbox."""
-        if pid in self._sandboxes:
-            del self._sandboxes[pid]
+        with self._lock:
+            if pid not in self._sandboxes:
+                return False
+            sandboxes = dict(self._sandboxes)
+            del sandboxes[pid]
+            self._sandboxes = sandboxes
             return True
-        return False
     
     def check_file_access(
         self,
         pid: int,
-        path: str,
+        path: str | bytes,
         access_type: str
     ) -> bool:
         """
@@ -214,58 +654,47 @@ class SecurityManager(Subsystem):
         
         Args:
             pid: Process ID
-            path: File path
+            path: File path, as str or as bytes in the filesystem encoding
             access_type: "read", "write", or "execute"
         
         Returns:
             True if access is allowed
         """
-        sandbox = self._sandboxes.get(pid)
+        sandboxes = self._sandboxes
+        if not sandboxes:
+            return True
         
+        sandbox = sandboxes.get(pid)
         if sandbox is None or not sandbox.enabled:
             return True
         
-        # Check denied paths
-        for denied in sandbox.denied_paths:
-            if path.startswith(denied):
-                self._audit(
-                    pid=pid,
-                    action="file_access",
-                    resource=path,
-                    result="denied",
-                    reason="Path in denied list"
-                )
-                raise SandboxViolationError(
-                    f"Access to {path} is denied",
-                    pid=pid,
-                    violation_type="file_access"
-                )
+        # Decoded once here; the rules, match cache and audit log are str
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
         
-        # Check allowed paths
-        for allowed in sandbox.allowed_paths:
-            if path.startswith(allowed):
+        rule = sandbox.path_matcher().match(path)
+        
+        # Check denied paths
+        if rule == _DENY:
+            self._deny(pid, "file_access", path, _PATH_DENIED)
+        
+        # Check allowed paths. Allows are counted, and only sampled into
+        # the audit log, since they far outnumber denials.
+        if rule == _ALLOW:
+            self._allowed_count += 1
+            sample = self.AUDIT_ALLOW_SAMPLE
+            if sample and not self._allowed_count % sample:
                 self._audit(
                     pid=pid,
                     action="file_access",
                     resource=path,
-                    result="allowed"
+                    result="allowed",
+                    reason=f"Sampled 1 in {sample} allows"
                 )
-                return True
+            return True
         
         # Default deny
-        self._audit(
-            pid=pid,
-            action="file_access",
-            resource=path,
-            result="denied",
-            reason="Path not in allowed list"
-        )
-        
-        raise SandboxViolationError(
-            f"Access to {path} is not allowed",
-            pid=pid,
-            violation_type="file_access"
-        )
+        self._deny(pid, "file_access", path, _PATH_NOT_ALLOWED)
     
     def check_syscall(
         self,
@@ -282,40 +711,59 @@ class SecurityManager(Subsystem):
         Returns:
             True if syscall is allowed
         """
-        sandbox = self._sandboxes.get(pid)
+        sandboxes = self._sandboxes
+        if not sandboxes:
+            return True
         
+        sandbox = sandboxes.get(pid)
         if sandbox is None or not sandbox.enabled:
             return True
         
-        if syscall_number in sandbox.denied_syscalls:
-            self._audit(
-                pid=pid,
-                action="syscall",
-                resource=str(syscall_number),
-                result="denied",
-                reason="Syscall in denied list"
-            )
+        if syscall_number < 0:
             raise SandboxViolationError(
-                f"Syscall {syscall_number} is denied",
+                f"Invalid syscall number: {syscall_number}",
                 pid=pid,
                 violation_type="syscall"
             )
         
-        if sandbox.allowed_syscalls and syscall_number not in sandbox.allowed_syscalls:
-            self._audit(
-                pid=pid,
-                action="syscall",
-                resource=str(syscall_number),
-                result="denied",
-                reason="Syscall not in allowed list"
-            )
-            raise SandboxViolationError(
-                f"Syscall {syscall_number} is not allowed",
-                pid=pid,
-                violation_type="syscall"
-            )
+        verdict = sandbox.syscall_checker()(syscall_number)
+        if verdict == _SYSCALL_OK:
+            return True
         
-        return True
+        self._deny(pid, "syscall", str(syscall_number), _SYSCALL_DENIALS[verdict])
+    
+    def _deny(
+        self,
+        pid: int,
+        action: str,
+        resource: str,
+        denial: tuple[str, str]
+    ) -> None:
+        """
+        Audit and raise a sandbox violation.
+        
+        Args:
+            pid: Process ID
+            action: Checked action, also used as the violation type
+            resource: Path or syscall that was refused
+            denial: (audit reason, error message template) pair
+        
+        Raises:
+            SandboxViolationError: Always
+        """
+        reason, message = denial
+        self._audit(
+            pid=pid,
+            action=action,
+            resource=resource,
+            result="denied",
+            reason=reason
+        )
+        raise SandboxViolationError(
+            message.format(resource),
+            pid=pid,
+            violation_type=action
+        )
     
     def check_resource_limit(
         self,
@@ -336,41 +784,42 @@ class SecurityManager(Subsystem):
         Returns:
             True if within limits
         """
-        sandbox = self._sandboxes.get(pid)
+        sandboxes = self._sandboxes
+        if not sandboxes:
+            return True
         
+        sandbox = sandboxes.get(pid)
         if sandbox is None:
             return True
         
-        limits = sandbox.limits
-        
-        limit_map = {
-            ResourceType.CPU_TIME: limits.cpu_time,
-            ResourceType.MEMORY: limits.memory,
-            ResourceType.FILE_DESCRIPTORS: limits.file_descriptors,
-            ResourceType.PROCESSES: limits.processes,
-            ResourceType.FILES: limits.files,
-            ResourceType.PIPES: limits.pipes,
-        }
-        
-        limit = limit_map.get(resource_type)
-        
-        if limit is not None and current + requested > limit:
-            self._audit(
-                pid=pid,
-                action="resource",
-                resource=resource_type.value,
-                result="denied",
-                reason=f"Limit exceeded: {current + requested} > {limit}"
-            )
-            raise ResourceLimitExceeded(
-                f"{resource_type.value} limit exceeded",
-                pid=pid,
-                resource_type=resource_type.value,
-                limit=limit
-            )
+        limit = sandbox.limits.as_tuple()[resource_type.index]
+        if current + requested > limit:
+            self._limit_exceeded(pid, resource_type, current + requested, limit)
         
         return True
     
+    def _limit_exceeded(
+        self,
+        pid: int,
+        resource_type: ResourceType,
+        total: int,
+        limit: int
+    ) -> None:
+        """Audit and raise a resource limit violation."""
+        self._audit(
+            pid=pid,
+            action="resource",
+            resource=resource_type.value,
+            result="denied",
+            reason=f"Limit exceeded: {total} > {limit}"
+        )
+        raise ResourceLimitExceeded(
+            f"{resource_type.value} limit exceeded",
+            pid=pid,
+            resource_type=resource_type.value,
+            limit=limit
+        )
+    
     def check_policy(
         self,
         context: dict[str, Any]
@@ -384,25 +833,69 @@ class SecurityManager(Subsystem):
         Returns:
             True if all policies pass
         """
-        for policy in self._policies:
-            if not policy.check(context):
-                if policy.action == "deny":
-                    raise PolicyViolationError(
-                        f"Policy '{policy.name}' violation",
-                        policy=policy.name
-                    )
+        self._policy_checks += 1
+        if not self._policy_checks & self.POLICY_REORDER_INTERVAL - 1:
+            # Periodically move the most violated policies to the front
+            self._policy_fn = None
+        
+        policy_fn = self._policy_fn or self.compile_policies()
+        policy = policy_fn(context)
+        if policy is not None:
+            self._policy_hits[policy.name] = self._policy_hits.get(policy.name, 0) + 1
+            raise PolicyViolationError(
+                f"Policy '{policy.name}' violation",
+                policy=policy.name
+            )
         
         return True
     
+    def compile_policies(self) -> Callable[[dict], Optional[Policy]]:
+        """
+        Fuse the deny policies into a single check function.
+        
+        Only deny policies can fail a check, so the others are left out.
+        The checks are generated as one straight-line function body.
+        The rest are ordered by how often they have been violated, so a
+        request that breaks a common rule is rejected after the fewest
+        calls. The function is cached for check_policy until the policy
+        set changes or is next reordered.
+        
+        Returns:
+            Function returning the first violated policy, or None
+        """
+        hits = self._policy_hits
+        policies = sorted(
+            (p for p in self._policies if p.action == "deny"),
+            key=lambda p: hits.get(p.name, 0),
+            reverse=True
+        )
+        
+        # Unroll the checks into straight-line code, so a request costs one
+        # frame plus one call per policy, with no loop or tuple unpacking
+        namespace: dict[str, Any] = {}
+        lines = ["def first_violation(context):"]
+        for i, policy in enumerate(policies):
+            namespace[f"check{i}"] = policy.check
+            namespace[f"policy{i}"] = policy
+            lines.append(f"    if not check{i}(context): return policy{i}")
+        lines.append("    return None")
+        exec(compile("\n".join(lines), "<security policies>", "exec"), namespace)
+        first_violation = namespace["first_violation"]
+        
+        self._policy_fn = first_violation
+        return first_violation
+    
     def add_policy(self, policy: Policy) -> None:
         """Add a security policy."""
         self._policies.append(policy)
+        self._policy_fn = None
     
     def remove_policy(self, name: str) -> bool:
         """Remove a policy by name."""
         for i, policy in enumerate(self._policies):
             if policy.name == name:
                 self._policies.pop(i)
+                self._policy_fn = None
                 return True
         return False
     
@@ -414,27 +907,56 @@ class SecurityManager(Subsystem):
         result: str,
         reason: str = ""
     ) -> None:
-        """Log a security event."""
-        import time
-        
-        event = {
-            'timestamp': time.time(),
-            'pid': pid,
-            'action': action,
-            'resource': resource,
-            'result': result,
-            'reason': reason
-        }
-        
-        self._audit_log.append(event)
+        """
+        Log a security event.
         
-        # Keep only last 1000 events
-        if len(self._audit_log) > 1000:
-            self._audit_log = self._audit_log[-1000:]
+        A run of identical events, such as a process retrying a denied
+        path, is collapsed into the first one, whose repeats count and
+        timestamp are updated.
+        """
+        log = self._audit_log
+        timestamp = _now()
+        with self._audit_lock:
+            if log.repeat_last(timestamp, pid, action, resource, result, reason):
+                return
+            
+            # The ring overwrites its oldest event once full
+            log.append(timestamp, pid, action, resource, result, reason)
+            full_batch = log.total - self._audit_flushed >= self.AUDIT_BATCH_SIZE
+        if full_batch:
+            self._audit_wakeup.set()
+    
+    def _run_audit_flush(self) -> None:
+        """Flush thread: write pending audit events to the logger in batches."""
+        while self._audit_running:
+            self._audit_wakeup.wait(self.AUDIT_FLUSH_INTERVAL)
+            self._audit_wakeup.clear()
+            try:
+                self._flush_audit()
+            except Exception as e:
+                self._logger.error(f"Error flushing audit events: {e}")
+    
+    def _flush_audit(self) -> None:
+        """Write all pending audit events to the logger as one record."""
+        log = self._audit_log
+        debug = self._logger.is_enabled_for(LogLevel.DEBUG)
+        with self._audit_lock:
+            total = log.total
+            pending = total - self._audit_flushed
+            self._audit_flushed = total
+            # Snapshot under the lock; the logger is called outside it
+            batch = log.events(pending) if pending and debug else None
+        
+        if batch:
+            self._logger.debug(
+                "Security audit events",
+                context={'count': len(batch), 'events': batch}
+            )
     
     def get_audit_log(self, limit: int = 100) -> List[dict]:
         """Get recent audit log entries."""
-        return self._audit_log[-limit:]
+        with self._audit_lock:
+            return self._audit_log.events(limit)
     
     def get_stats(self) -> dict[str, Any]:
         """Get security statistics."""
@@ -442,4 +964,48 @@ class SecurityManager(Subsystem):
             'active_sandboxes': len(self._sandboxes),
             'policies': len(self._policies),
             'audit_entries': len(self._audit_log),
+            'allowed_checks': self._allowed_count,
         }
+
+
+def _make_limit_check(resource_type: ResourceType) -> Callable[..., bool]:
+    """
+    Build a check_<resource> method for one resource type.
+    
+    The limit's position is resolved here, so callers that know which
+    resource they are checking skip the enum lookup in
+    check_resource_limit.
+    """
+    index = resource_type.index
+    
+    def check(self: SecurityManager, pid: int, current: int, requested: int) -> bool:
+        sandboxes = self._sandboxes
+        if not sandboxes:
+            return True
+        
+        sandbox = sandboxes.get(pid)
+        if sandbox is None:
+            return True
+        
+        limit = sandbox.limits.as_tuple()[index]
+        if current + requested > limit:
+            self._limit_exceeded(pid, resource_type, current + requested, limit)
+        return True
+    
+    check.__name__ = f"check_{resource_type.value}"
+    check.__qualname__ = f"SecurityManager.{check.__name__}"
+    check.__doc__ = (
+        f"Check the {resource_type.value} limit; "
+        f"check_resource_limit(pid, ResourceType.{resource_type.name}, ...)."
+    )
+    return check
+
+
+# SecurityManager.check_cpu_time, check_memory, ... one per resource type
+for _resource_type in ResourceType:
+    setattr(
+        SecurityManager,
+        f"check_{_resource_type.value}",
+        _make_limit_check(_resource_type)
+    )
+del _resource_type
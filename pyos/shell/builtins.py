@@ -8,8 +8,18 @@ Version: 1.0.0
 """
 
 from typing import Optional, Any, Callable, List
+import sys
 import time
 
+from pyos.filesystem.path_resolver import PathResolver
+
+
+# 'rwx'-style string for each 3-bit permission group
+_PERM_STR = tuple(
+    ('r' if m & 4 else '-') + ('w' if m & 2 else '-') + ('x' if m & 1 else '-')
+    for m in range(8)
+)
+
 
 class BuiltinCommands:
     """
@@ -17,8 +27,14 @@ class BuiltinCommands:
     
     These commands are executed directly by the shell without
     creating a new process.
+    
+    stat and readdir results are cached briefly, since interactive use
+    lists and reads the same paths over and over. The commands that
+    modify the filesystem clear the caches.
     """
     
+    CACHE_TTL = 0.5  # Seconds a cached stat/readdir result stays valid
+    
     def __init__(self, shell):
         """
         Initialize built-in commands.
@@ -27,6 +43,9 @@ class BuiltinCommands:
             shell: The shell instance
         """
         self._shell = shell
+        # Resolved path -> (time cached, result)
+        self._stat_cache: dict[str, tuple[float, Any]] = {}
+        self._readdir_cache: dict[str, tuple[float, List[dict[str, Any]]]] = {}
         self._commands: dict[str, Callable] = {
             'help': self.cmd_help,
             'exit': self.cmd_exit,
@@ -95,6 +114,51 @@ class BuiltinCommands:
     
     # Command implementations
     
+    def _cached_stat(self, path: str) -> Any:
+        """
+        Stat a path relative to the shell's cwd, through the stat cache.
+        
+        Args:
+            path: Path to stat
+        
+        Returns:
+            Inode or None if not found
+        """
+        resolved = PathResolver.resolve(path, self._shell.cwd)
+        now = time.monotonic()
+        hit = self._stat_cache.get(resolved)
+        if hit is not None and now - hit[0] < self.CACHE_TTL:
+            return hit[1]
+        
+        inode = self._shell.kernel.filesystem.stat(resolved)
+        self._stat_cache[resolved] = (now, inode)
+        return inode
+    
+    def _cached_readdir(self, path: str) -> List[dict[str, Any]]:
+        """
+        List a directory relative to the shell's cwd, through the readdir cache.
+        
+        Args:
+            path: Directory path
+        
+        Returns:
+            List of directory entries, shared with the cache
+        """
+        resolved = PathResolver.resolve(path, self._shell.cwd)
+        now = time.monotonic()
+        hit = self._readdir_cache.get(resolved)
+        if hit is not None and now - hit[0] < self.CACHE_TTL:
+            return hit[1]
+        
+        entries = self._shell.kernel.filesystem.readdir(resolved)
+        self._readdir_cache[resolved] = (now, entries)
+        return entries
+    
+    def invalidate_fs_cache(self) -> None:
+        """Drop cached stat and readdir results after a modification."""
+        self._stat_cache.clear()
+        self._readdir_cache.clear()
+    
     def cmd_help(self, args: List[str]) -> int:
         """Display help information."""
         help_text = """
@@ -161,30 +225,34 @@ Shell:
         gid = self._shell.current_gid
         
         try:
-            entries = kernel.filesystem.readdir(path, self._shell.cwd)
+            entries = self._cached_readdir(path)
             
+            # Written in one call rather than a print per entry. A directory
+            # holds few distinct (type, mode) pairs, so each pair's
+            # permission column is built once.
+            lines = []
+            append = lines.append
+            perms: dict[tuple[str, str], str] = {}
             for entry in entries:
-                if entry['name'] in ('.', '..'):
-                    continue
-                
-                # Format: permissions size name
-                if entry['type'] == 'DIRECTORY':
-                    perm = 'd'
-                else:
-                    perm = '-'
-                
-                perm += 'r' if int(entry['mode'], 8) & 0o400 else '-'
-                perm += 'w' if int(entry['mode'], 8) & 0o200 else '-'
-                perm += 'x' if int(entry['mode'], 8) & 0o100 else '-'
-                
-                size = str(entry['size']).rjust(8)
                 name = entry['name']
+                if name == '.' or name == '..':
+                    continue
                 
-                if entry['type'] == 'DIRECTORY':
-                    name += '/'
+                # Format: permissions size name (owner permissions only)
+                key = (entry['type'], entry['mode'])
+                perm = perms.get(key)
+                if perm is None:
+                    perm = perms[key] = (
+                        ('d' if key[0] == 'DIRECTORY' else '-')
+                        + _PERM_STR[int(key[1], 8) >> 6 & 7]
+                    )
                 
-                print(f"{perm} {size} {name}")
+                if key[0] == 'DIRECTORY':
+                    append(f"{perm} {entry['size']:>8} {name}/\n")
+                else:
+                    append(f"{perm} {entry['size']:>8} {name}\n")
             
+            sys.stdout.write(''.join(lines))
             return 0
             
         except Exception as e:
@@ -204,7 +272,6 @@ Shell:
             return 1
         
         # Resolve path
-        from pyos.filesystem.path_resolver import PathResolver
         resolved = PathResolver.resolve(path, self._shell.cwd)
         
         if kernel.filesystem.is_directory(resolved):
@@ -239,6 +306,7 @@ Shell:
                     gid=self._shell.current_gid,
                     cwd=self._shell.cwd
                 )
+                self.invalidate_fs_cache()
             except Exception as e:
                 print(f"mkdir: cannot create directory '{path}': {e}")
                 return 1
@@ -264,6 +332,7 @@ Shell:
                     gid=self._shell.current_gid,
                     cwd=self._shell.cwd
                 )
+                self.invalidate_fs_cache()
             except Exception as e:
                 print(f"rmdir: failed to remove '{path}': {e}")
                 return 1
@@ -283,17 +352,14 @@ Shell:
         
         for path in args:
             try:
-                inode = kernel.filesystem.stat(path, self._shell.cwd)
-                if inode:
-                    inode.touch()
-                else:
-                    kernel.filesystem.create(
-                        path,
-                        mode=0o644,
-                        uid=self._shell.current_uid,
-                        gid=self._shell.current_gid,
-                        cwd=self._shell.cwd
-                    )
+                kernel.filesystem.touch(
+                    path,
+                    mode=0o644,
+                    uid=self._shell.current_uid,
+                    gid=self._shell.current_gid,
+                    cwd=self._shell.cwd
+                )
+                self.invalidate_fs_cache()
             except Exception as e:
                 print(f"touch: cannot touch '{path}': {e}")
                 return 1
@@ -319,6 +385,7 @@ Shell:
                     gid=self._shell.current_gid,
                     cwd=self._shell.cwd
                 )
+                self.invalidate_fs_cache()
             except Exception as e:
                 print(f"rm: cannot remove '{path}': {e}")
                 return 1
@@ -338,7 +405,7 @@ Shell:
         
         for path in args:
             try:
-                inode = kernel.filesystem.stat(path, self._shell.cwd)
+                inode = self._cached_stat(path)
                 if not inode:
                     print(f"cat: {path}: No such file")
                     return 1
@@ -365,12 +432,13 @@ Shell:
         
         processes = kernel.process_manager.list_processes()
         
-        print(f"{'PID':>6} {'PPID':>6} {'STATE':<10} {'NAME':<20}")
-        print("-" * 50)
-        
+        lines = [f"{'PID':>6} {'PPID':>6} {'STATE':<10} {'NAME':<20}\n", "-" * 50 + "\n"]
         for proc in processes:
-            print(f"{proc['pid']:>6} {proc['ppid']:>6} {proc['state']:<10} {proc['name']:<20}")
+            lines.append(
+                f"{proc['pid']:>6} {proc['ppid']:>6} {proc['state']:<10} {proc['name']:<20}\n"
+            )
         
+        sys.stdout.write(''.join(lines))
         return 0
     
     def cmd_kill(self, args: List[str]) -> int:
@@ -431,6 +499,7 @@ Shell:
                 gid=self._shell.current_gid,
                 cwd=self._shell.cwd
             )
+            self.invalidate_fs_cache()
             
             return 0
             
@@ -463,6 +532,7 @@ Shell:
                 uid=self._shell.current_uid,
                 cwd=self._shell.cwd
             )
+            self.invalidate_fs_cache()
             
             return 0
             
@@ -520,16 +590,16 @@ Shell:
     def cmd_history(self, args: List[str]) -> int:
         """Display command history."""
         history = self._shell.parser.get_history()
-        for i, cmd in enumerate(history, 1):
-            print(f"{i:>5}  {cmd}")
+        sys.stdout.write(''.join(
+            f"{i:>5}  {cmd}\n" for i, cmd in enumerate(history, 1)
+        ))
         return 0
     
     def cmd_export(self, args: List[str]) -> int:
         """Set environment variable."""
         if not args:
             # Print all environment
-            for key, value in self._shell.environ.items():
-                print(f"{key}={value}")
+            self._write_environ()
             return 0
         
         for arg in args:
@@ -543,10 +613,15 @@ Shell:
     
     def cmd_env(self, args: List[str]) -> int:
         """Display environment variables."""
-        for key, value in self._shell.environ.items():
-            print(f"{key}={value}")
+        self._write_environ()
         return 0
     
+    def _write_environ(self) -> None:
+        """Write the environment as KEY=value lines in one call."""
+        sys.stdout.write(''.join(
+            f"{key}={value}\n" for key, value in self._shell.environ.items()
+        ))
+    
     def cmd_date(self, args: List[str]) -> int:
         """Display current date and time."""
         print(time.strftime('%a %b %d %H:%M:%S %Z %Y'))
@@ -296,6 +296,7 @@ class Shell:
             
             self._kernel.filesystem.write(fd, data)
             self._kernel.filesystem.close(fd)
+            self._builtins.invalidate_fs_cache()
             
             return True
         except Exception as e:
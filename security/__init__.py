@@ -11,6 +11,7 @@ Provides security services:
 from .sandbox import (
     SecurityManager,
     Sandbox,
+    SyscallSet,
     ResourceLimits,
     ResourceType,
     Policy
@@ -19,6 +20,7 @@ from .sandbox import (
 __all__ = [
     'SecurityManager',
     'Sandbox',
+    'SyscallSet',
     'ResourceLimits',
     'ResourceType',
     'Policy',
@@ -78,12 +78,41 @@ class TestLogger(unittest.TestCase):
         
         self.assertIs(log1, log2)  # Same subsystem = same instance
     
+    def test_kernel_log_buffer(self):
+        """Test log calls land in the kernel buffer exactly once."""
+        from logger import Logger, LogLevel
+        
+        Logger.initialize(level=LogLevel.DEBUG)
+        Logger('test_ring').warning("ring entry", pid=7, context={'k': 1})
+        
+        logs = Logger.get_kernel_logs(subsystem='test_ring')
+        self.assertEqual(len(logs), 1)
+        self.assertEqual(logs[0]['message'], "ring entry")
+        self.assertEqual(logs[0]['pid'], 7)
+        self.assertEqual(logs[0]['context'], {'k': 1})
+    
     def test_log_levels(self):
         """Test log level filtering."""
         from logger import LogLevel
         
         self.assertTrue(LogLevel.ERROR > LogLevel.INFO)
         self.assertTrue(LogLevel.DEBUG < LogLevel.WARNING)
+    
+    def test_set_level_specializes(self):
+        """Test disabled log methods are swapped for no-ops."""
+        from logger import Logger, LogLevel
+        
+        Logger.initialize(level=LogLevel.DEBUG)
+        log = Logger('test_level')
+        
+        Logger.set_level(LogLevel.WARNING)
+        try:
+            self.assertIn('debug', vars(log))
+            self.assertNotIn('error', vars(log))
+        finally:
+            Logger.set_level(LogLevel.DEBUG)
+        
+        self.assertNotIn('debug', vars(log))
 
 
 class TestConfig(unittest.TestCase):
@@ -175,6 +204,99 @@ class TestProcessManagement(unittest.TestCase):
         
         next_proc = scheduler.get_next_process()
         self.assertEqual(next_proc.pid, 2)
+    
+    def test_scheduler_work_stealing(self):
+        """Test that an idle worker steals from a sibling's queue."""
+        from process.scheduler import RoundRobinScheduler
+        from process.pcb import ProcessControlBlock
+        
+        scheduler = RoundRobinScheduler(quantum=100, num_workers=2)
+        for pid in (2, 4, 6):
+            scheduler.add_process(
+                ProcessControlBlock(pid=pid, parent_pid=0, name=f"p{pid}")
+            )
+        
+        # Worker 1 owns no processes, so it steals from the back of worker 0
+        self.assertEqual(scheduler.get_next_process(1).pid, 6)
+        self.assertEqual(scheduler.get_next_process(0).pid, 2)
+        self.assertEqual(scheduler.count(), 1)
+    
+    def test_submitted_process_runs_before_rescheduled(self):
+        """Test that a submitted process is not queued behind a later reschedule."""
+        from process.scheduler import (
+            RoundRobinScheduler, PriorityScheduler, MultiLevelFeedbackQueueScheduler
+        )
+        from process.pcb import ProcessControlBlock
+        
+        # MLFQ demotes a preempted process, so it is rescheduled as a yield
+        cases = (
+            (RoundRobinScheduler(quantum=100), False),
+            (PriorityScheduler(enable_aging=False), False),
+            (MultiLevelFeedbackQueueScheduler(), True),
+        )
+        for scheduler, yielded in cases:
+            a = ProcessControlBlock(pid=2, parent_pid=0, name="a")
+            b = ProcessControlBlock(pid=3, parent_pid=0, name="b")
+            scheduler.add_process(a)
+            self.assertIs(scheduler.get_next_process(), a)
+            
+            # b is created while a runs, then a is preempted
+            scheduler.submit_process(b)
+            scheduler.reschedule(a, yielded=yielded)
+            self.assertIs(scheduler.get_next_process(), b)
+            self.assertIs(scheduler.get_next_process(), a)
+    
+    def test_weighted_priority_scheduler(self):
+        """Test that weights give lower priority levels a share of each round."""
+        from process.scheduler import PriorityScheduler
+        from process.pcb import ProcessControlBlock
+        
+        scheduler = PriorityScheduler(
+            priority_levels=2, enable_aging=False, weights=[3, 1]
+        )
+        for pid, priority in ((2, 0), (3, 0), (4, 0), (5, 0), (6, 1), (7, 1)):
+            scheduler.add_process(
+                ProcessControlBlock(pid=pid, parent_pid=0, name=f"p{pid}",
+                                    priority=priority)
+            )
+        
+        order = [scheduler.get_next_process().pid for _ in range(6)]
+        self.assertEqual(order, [2, 3, 4, 6, 5, 7])
+    
+    def test_reap_zombie_tree(self):
+        """Test that reaping clears a whole tree of zombies at once."""
+        from process.process_manager import ProcessManager
+        
+        pm = ProcessManager()
+        pm.initialize()
+        
+        parent = pm.create_process("parent")
+        child = pm.create_process("child", parent_pid=parent)
+        pm.create_process("grandchild", parent_pid=child)
+        
+        pm.terminate_process(parent)
+        self.assertEqual(pm.get_stats()['zombie_processes'], 3)
+        
+        self.assertEqual(len(pm.reap_zombies()), 3)
+        self.assertEqual(pm.get_stats()['zombie_processes'], 0)
+        self.assertEqual(pm.process_count, 1)
+    
+    def test_removed_pcb_not_reused(self):
+        """Test that a held PCB of a reaped process is never handed to a new one."""
+        from process.process_manager import ProcessManager
+        
+        pm = ProcessManager()
+        pm.initialize()
+        
+        a = pm.create_process("a")
+        held = pm.get_process(a)
+        pm.terminate_process(a)
+        pm.reap_zombies()
+        b = pm.create_process("b")
+        
+        self.assertIsNot(held, pm.get_process(b))
+        self.assertEqual(held.pid, a)
+        self.assertEqual(held.name, "a")
 
 
 class TestMemoryManagement(unittest.TestCase):
@@ -196,6 +318,43 @@ class TestMemoryManagement(unittest.TestCase):
         self.assertTrue(allocator.free(frame1))
         self.assertEqual(allocator.free_frames, 99)
     
+    def test_frame_allocator_batch(self):
+        """Test batch and contiguous frame allocation."""
+        from memory.paging import FrameAllocator
+        
+        allocator = FrameAllocator(total_frames=100)
+        
+        frames = allocator.allocate_many(90)
+        self.assertEqual(len(set(frames)), 90)
+        self.assertIsNone(allocator.allocate_many(11))
+        self.assertEqual(allocator.free_frames, 10)
+        
+        self.assertEqual(allocator.free_many(frames), 90)
+        start = allocator.allocate_contiguous(100)
+        self.assertEqual(start, 0)
+        self.assertEqual(allocator.free_frames, 0)
+    
+    def test_frame_allocator_magazines(self):
+        """Test double frees and thread exit with per-thread magazines."""
+        import threading
+        from memory.paging import FrameAllocator
+        
+        allocator = FrameAllocator(total_frames=100)
+        frame = allocator.allocate_many(1)[0]
+        self.assertTrue(allocator.free(frame))
+        self.assertFalse(allocator.free(frame))
+        self.assertFalse(allocator.is_allocated(frame))
+        
+        # A worker's magazine is handed back when the worker exits
+        worker = threading.Thread(
+            target=lambda: allocator.free(allocator.allocate())
+        )
+        worker.start()
+        worker.join()
+        self.assertEqual(len(allocator._magazines), 1)
+        self.assertEqual(allocator.free_frames, 100)
+        self.assertEqual(len(allocator.allocate_many(100)), 100)
+    
     def test_page_table(self):
         """Test page table operations."""
         from memory.paging import PageTable, PageFlags
@@ -211,6 +370,21 @@ class TestMemoryManagement(unittest.TestCase):
         frame = pt.translate(0)
         self.assertIsNone(frame)
     
+    def test_memory_manager_allocate(self):
+        """Test allocation for a process without an address space."""
+        from memory.memory_manager import MemoryManager
+        
+        mm = MemoryManager()
+        mm.initialize()
+        
+        addr = mm.allocate(10000, pid=7)
+        self.assertEqual(mm.get_process_memory_usage(7), 3 * mm.page_size)
+        self.assertIsNotNone(mm.translate(addr + 5, pid=7))
+        
+        mm.free(addr, pid=7)
+        self.assertIsNone(mm.translate(addr, pid=7))
+        self.assertEqual(mm.get_process_memory_usage(7), 0)
+    
     def test_buddy_allocator(self):
         """Test buddy allocator."""
         from memory.allocator import BuddyAllocator
@@ -224,6 +398,22 @@ class TestMemoryManagement(unittest.TestCase):
         self.assertGreater(stats['allocated_blocks'], 0)
         
         self.assertTrue(allocator.free(addr1))
+    
+    def test_slab_allocator(self):
+        """Test slab allocation reuses freed objects and grows."""
+        from memory.allocator import SlabAllocator
+        
+        slab = SlabAllocator(object_size=1024, slab_size=4096)
+        
+        indices = [slab.allocate() for _ in range(4)]
+        self.assertEqual(indices, [0, 1, 2, 3])
+        
+        self.assertTrue(slab.free(2))
+        self.assertEqual(slab.allocate(), 2)
+        self.assertFalse(slab.free(99))
+        
+        self.assertEqual(slab.allocate(), 4)  # Grows a new slab
+        self.assertEqual(slab.get_stats()['total_slabs'], 2)
 
 
 class TestFilesystem(unittest.TestCase):
@@ -359,6 +549,87 @@ class TestSecurity(unittest.TestCase):
         
         self.assertEqual(limits.cpu_time, 60)
         self.assertEqual(limits.memory, 1024*1024)
+    
+    def test_resource_limit_checks(self):
+        """Test per-resource limit checks."""
+        from security.sandbox import SecurityManager, ResourceLimits, ResourceType
+        from pyos.exceptions import ResourceLimitExceeded
+        
+        security = SecurityManager()
+        security.initialize()
+        security.create_sandbox(pid=42, limits=ResourceLimits(memory=1024))
+        
+        self.assertTrue(security.check_memory(42, 512, 512))
+        self.assertTrue(security.check_memory(7, 4096, 4096))
+        with self.assertRaises(ResourceLimitExceeded):
+            security.check_memory(42, 1000, 100)
+        with self.assertRaises(ResourceLimitExceeded):
+            security.check_resource_limit(42, ResourceType.MEMORY, 1000, 100)
+    
+    def test_sandbox_file_access(self):
+        """Test sandbox path rules."""
+        from security.sandbox import SecurityManager
+        from pyos.exceptions import SandboxViolationError
+        
+        security = SecurityManager()
+        security.initialize()
+        sandbox = security.create_sandbox(pid=42, allowed_paths=['/tmp'])
+        sandbox.denied_paths.append('/tmp/secret')
+        
+        self.assertTrue(security.check_file_access(42, '/tmp/a.txt', 'read'))
+        self.assertTrue(security.check_file_access(42, b'/tmp/b.txt', 'read'))
+        for path in ('/tmp/secret/key', '/tmpx', '/etc/passwd', '/tmp/../etc/passwd',
+                     'tmp/x', './tmp', 'tmp'):
+            with self.assertRaises(SandboxViolationError):
+                security.check_file_access(42, path, 'read')
+    
+    def test_sandbox_syscalls(self):
+        """Test sandbox syscall rules."""
+        from security.sandbox import SecurityManager
+        from pyos.exceptions import SandboxViolationError
+        
+        security = SecurityManager()
+        security.initialize()
+        sandbox = security.create_sandbox(pid=42)
+        
+        self.assertTrue(security.check_syscall(42, 60))
+        sandbox.allowed_syscalls.update({0, 1, 60})
+        sandbox.denied_syscalls.add(1)
+        
+        self.assertTrue(security.check_syscall(42, 60))
+        for number in (1, 2):
+            with self.assertRaises(SandboxViolationError):
+                security.check_syscall(42, number)
+        
+        # Plain sets assigned after creation are accepted too
+        sandbox.allowed_syscalls = {3}
+        sandbox.denied_syscalls = set()
+        self.assertTrue(security.check_syscall(42, 3))
+        with self.assertRaises(SandboxViolationError):
+            security.check_syscall(42, 60)
+    
+    def test_concurrent_audit(self):
+        """Test that audit events from concurrent threads are all kept."""
+        import threading
+        from security.sandbox import SecurityManager
+        
+        security = SecurityManager()
+        security.initialize()
+        
+        def audit(pid):
+            for i in range(200):
+                security._audit(pid, "open", f"/data/{i}", "denied")
+        
+        workers = [threading.Thread(target=audit, args=(pid,)) for pid in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        events = security.get_audit_log(limit=1000)
+        self.assertEqual(security._audit_log.total, 800)
+        self.assertEqual(len(events), 800)
+        self.assertEqual(sum(event['repeats'] for event in events), 800)
 
 
 class TestMonitoring(unittest.TestCase):